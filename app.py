@@ -7,12 +7,15 @@ from flask_restful import Api
 from routes.generics.generics_routes import add_generics_routes
 from routes.tulipr.tulip_routes import add_tulip_routes
 from routes.settings.settings_routes import add_settings_routes
+from routes.utils import finalizeResponse
 
 config = configparser.ConfigParser()
 config.read("config.ini")
 
 app = Flask(__name__)
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = config.getint('api', 'static_max_age', fallback=31536000)
 api = Api(app)
+app.after_request(finalizeResponse)
 
 add_generics_routes(api)
 add_tulip_routes(api)
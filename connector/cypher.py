@@ -0,0 +1,106 @@
+"""
+Cypher query builder: values always travel as $parameters, so the text of a query only depends on
+the shape of the request and neo4j reuses its cached plan. The only things interpolated in the text
+are identifiers (labels, property keys) validated by label() / key().
+"""
+import re
+import threading
+from werkzeug.exceptions import BadRequest
+from connector import neo4j
+
+IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+DIRECTIONS = ('ASC', 'DESC')
+
+
+class InvalidIdentifier(BadRequest):
+    pass
+
+
+class Identifier(str):
+    pass
+
+
+def key(name):
+    if not isinstance(name, str) or not IDENTIFIER.match(name):
+        raise InvalidIdentifier("Invalid identifier: %r" % (name,))
+    return Identifier(name)
+
+
+def label(name):
+    # One or several labels separated by ':', e.g. Link:Prop
+    if not isinstance(name, str):
+        raise InvalidIdentifier("Invalid label: %r" % (name,))
+    return Identifier(':'.join(key(l) for l in name.split(':')))
+
+
+def direction(name):
+    if not isinstance(name, str) or name.upper() not in DIRECTIONS:
+        raise InvalidIdentifier("Invalid order direction: %r" % (name,))
+    return Identifier(name.upper())
+
+
+class QueryTexts(object):
+    """
+    Distinct query texts sent through the builder, the plan cache of neo4j holds one plan per text.
+    Only the first `limit` texts are remembered, the counter keeps going.
+    """
+    def __init__(self, limit):
+        super(QueryTexts, self).__init__()
+        self.limit = limit
+        self.texts = set()
+        self.overflow = 0
+        self.runs = 0
+        self.lock = threading.Lock()
+
+    def add(self, text):
+        with self.lock:
+            self.runs += 1
+            if text in self.texts:
+                return
+            if len(self.texts) < self.limit:
+                self.texts.add(text)
+            else:
+                self.overflow += 1
+
+    def getStats(self):
+        with self.lock:
+            return {'distinct': len(self.texts) + self.overflow, 'runs': self.runs}
+
+
+texts = QueryTexts(10000)
+
+
+class Query(object):
+    def __init__(self, text='', *identifiers, **parameters):
+        super(Query, self).__init__()
+        self.parts = []
+        self.parameters = {}
+        if text:
+            self.add(text, *identifiers, **parameters)
+
+    def add(self, text, *identifiers, **parameters):
+        # text is a %s template for the identifiers only, and integers (generated variable suffixes)
+        for i in identifiers:
+            if not isinstance(i, (Identifier, int)):
+                raise TypeError("Only identifiers validated by label() or key() are interpolated: %r" % (i,))
+        self.parts.append(text % identifiers if identifiers else text)
+        self.parameters.update(parameters)
+        return self
+
+    def param(self, value, prefix='p'):
+        # Register an anonymous parameter, returns its placeholder
+        name = '%s%s' % (prefix, len(self.parameters))
+        self.parameters[name] = value
+        return '$' + name
+
+    @property
+    def text(self):
+        return ''.join(self.parts)
+
+    def run(self):
+        texts.add(self.text)
+        return neo4j.query_neo4j(self.text, self.parameters)
+
+    def stream(self):
+        texts.add(self.text)
+        return neo4j.stream_neo4j(self.text, self.parameters)
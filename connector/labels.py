@@ -0,0 +1,109 @@
+import configparser
+import threading
+import time
+
+from connector import neo4j
+
+config = configparser.ConfigParser()
+config.read("config.ini")
+
+
+class LabelStats(object):
+    """
+    Snapshot of the label combinations of the graph with their node counts, behind the label listing and
+    counting endpoints. It is recomputed in background every `interval` seconds; in between the write paths
+    apply the deltas they know (add, remove) once committed, and call invalidate() when they do not know them,
+    which triggers a recompute after `delay` seconds. Reads never wait for a scan, except the very first one.
+    """
+    def __init__(self, interval, delay):
+        super(LabelStats, self).__init__()
+        self.interval = interval
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+        self.combos = None
+        self.computed_at = 0
+        self.stale = False
+        self.refreshes = 0
+        self.deltas = 0
+        self.failures = 0
+
+    def compute(self):
+        combos = {}
+        for record in neo4j.query_neo4j("MATCH (n) RETURN labels(n) AS labels, count(*) AS count"):
+            combos[tuple(sorted(record['labels']))] = record['count']
+        return combos
+
+    def refresh(self):
+        self.stale = False
+        combos = self.compute()
+        with self.lock:
+            self.combos = combos
+            self.computed_at = time.time()
+            self.refreshes += 1
+
+    def run(self):
+        while True:
+            self.wake.wait(self.interval)
+            if self.wake.is_set():
+                # Let a burst of writes settle before scanning
+                time.sleep(self.delay)
+                self.wake.clear()
+            try:
+                self.refresh()
+            except Exception:
+                self.failures += 1
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='label-stats')
+                self.thread.daemon = True
+                self.thread.start()
+
+    def getCombos(self):
+        if self.combos is None:
+            self.refresh()
+        self.start()
+        with self.lock:
+            return dict(self.combos)
+
+    def getCounts(self):
+        counts = {}
+        for labels, count in self.getCombos().items():
+            for label in labels:
+                counts[label] = counts.get(label, 0) + count
+        return counts
+
+    def add(self, labels, count=1):
+        with self.lock:
+            if self.combos is None:
+                return
+            key = tuple(sorted(labels))
+            self.combos[key] = self.combos.get(key, 0) + count
+            if self.combos[key] <= 0:
+                del self.combos[key]
+            self.deltas += 1
+
+    def remove(self, labels, count=1):
+        self.add(labels, -count)
+
+    def invalidate(self):
+        self.stale = True
+        self.wake.set()
+
+    def getStats(self):
+        with self.lock:
+            return {'combinations': len(self.combos) if self.combos is not None else 0,
+                    'loaded': self.combos is not None,
+                    'age': time.time() - self.computed_at if self.combos is not None else None,
+                    'stale': self.stale,
+                    'interval': self.interval,
+                    'refreshes': self.refreshes,
+                    'deltas': self.deltas,
+                    'failures': self.failures}
+
+
+stats = LabelStats(config.getint('labels', 'refresh_interval', fallback=300),
+                   config.getint('labels', 'refresh_delay', fallback=5))
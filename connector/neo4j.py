@@ -1,20 +1,184 @@
 import configparser
-from neo4j.v1 import GraphDatabase, basic_auth
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from neo4j.v1 import GraphDatabase, basic_auth, ResultError
 
 config = configparser.ConfigParser()
 config.read("config.ini")
 
+pool_size = config.getint('neo4j', 'pool_size', fallback=50)
+acquire_timeout = config.getfloat('neo4j', 'acquire_timeout', fallback=30)
+
 # Connect to the database
 driver = GraphDatabase.driver(
     "bolt://%s" % config['neo4j']['url'],
-    auth=basic_auth(config['neo4j']['user'], config['neo4j']['password'])
+    auth=basic_auth(config['neo4j']['user'], config['neo4j']['password']),
+    max_pool_size=pool_size
 )
 
 
-def query_neo4j(request):
-    session = driver.session()
-    result = session.run(request)
-    session.close()
-    return result
+class PoolTimeout(Exception):
+    pass
+
+
+class SessionPool(object):
+    """
+    Bound the number of sessions checked out of the driver at the same time,
+    the driver recycles the idle ones (up to max_pool_size).
+    """
+    def __init__(self, size, timeout):
+        super(SessionPool, self).__init__()
+        self.size = size
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+        self.in_use = 0
+        self.peak = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.wait_time = 0
+        self.read_transactions = 0
+        self.write_transactions = 0
+
+    def acquire(self):
+        start = time.time()
+        if not self.slots.acquire(timeout=self.timeout):
+            with self.lock:
+                self.timeouts += 1
+            raise PoolTimeout("No neo4j session available after %ss" % self.timeout)
+        try:
+            session = driver.session()
+        except Exception:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.in_use += 1
+            self.peak = max(self.peak, self.in_use)
+            self.acquired += 1
+            self.wait_time += time.time() - start
+        return session
+
+    def release(self, session):
+        try:
+            session.close()
+        finally:
+            with self.lock:
+                self.in_use -= 1
+            self.slots.release()
+
+    def getStats(self):
+        with self.lock:
+            return {'size': self.size,
+                    'timeout': self.timeout,
+                    'inUse': self.in_use,
+                    'peak': self.peak,
+                    'acquired': self.acquired,
+                    'timeouts': self.timeouts,
+                    'averageWait': round(self.wait_time / self.acquired, 4) if self.acquired else 0,
+                    'readTransactions': self.read_transactions,
+                    'writeTransactions': self.write_transactions}
+
+
+pool = SessionPool(pool_size, acquire_timeout)
+local = threading.local()
+
+
+class BufferedResult(object):
+    """
+    Fully consumed statement result: the session can go back to the pool right away.
+    """
+    def __init__(self, result):
+        super(BufferedResult, self).__init__()
+        self.records = list(result)
+        self.summary = result.consume()
+        self._keys = result.keys()
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def keys(self):
+        return self._keys
+
+    def consume(self):
+        return self.summary
+
+    def single(self):
+        if len(self.records) == 0:
+            raise ResultError("Cannot retrieve a single record, because this result is empty.")
+        elif len(self.records) != 1:
+            raise ResultError("Expected a result with a single record, but this result contains at least one more.")
+        return self.records[0]
+
+
+@contextmanager
+def session():
+    # Every query_neo4j of the block reuses the same session
+    current = getattr(local, 'session', None)
+    if current is not None:
+        yield current
+        return
+    current = local.session = pool.acquire()
+    try:
+        yield current
+    finally:
+        local.session = None
+        pool.release(current)
+
+
+@contextmanager
+def transaction(write):
+    # Every query_neo4j of the block runs in the same transaction, committed at the end of the block
+    # and rolled back on exception. Nested blocks join the outer transaction.
+    current = getattr(local, 'transaction', None)
+    if current is not None:
+        yield current
+        return
+    with session() as s:
+        with pool.lock:
+            if write:
+                pool.write_transactions += 1
+            else:
+                pool.read_transactions += 1
+        current = local.transaction = s.begin_transaction()
+        try:
+            yield current
+        except Exception:
+            local.transaction = None
+            current.rollback()
+            raise
+        local.transaction = None
+        current.commit()
+
+
+def in_session(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with session():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def read_transaction():
+    return transaction(False)
+
+
+def write_transaction():
+    return transaction(True)
+
+
+def query_neo4j(request, parameters=None):
+    current = getattr(local, 'transaction', None)
+    if current is not None:
+        return BufferedResult(current.run(request, parameters))
+    with session() as s:
+        return BufferedResult(s.run(request, parameters))
 
 
+def stream_neo4j(request, parameters=None):
+    # Records are fetched while iterating, the session must stay bound (session() or transaction() block)
+    current = getattr(local, 'transaction', None) or getattr(local, 'session', None)
+    if current is None:
+        return query_neo4j(request, parameters)
+    return current.run(request, parameters)
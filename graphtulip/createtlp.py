@@ -1,14 +1,64 @@
-from connector import neo4j, mongo
-from neo4j.v1 import ResultError
+from connector import neo4j, cypher
+from graphtulip.models import registry, parseColor
 from tulip import *
 import configparser
 import names
 import random
+import time
 
 config = configparser.ConfigParser()
 config.read("config.ini")
 
 
+class GraphIngestor(object):
+    """
+    Single pass conversion of driver records into the tulip graph of a CreateTlp.
+    Nodes are deduplicated by neo4j id, edges by (neo4j id, source, target): an edge
+    element reached again between other nodes is added as a numbered duplicate (d1_, d2_, ...).
+    """
+    def __init__(self, creator, args):
+        super(GraphIngestor, self).__init__()
+        self.creator = creator
+        self.args = args
+        self.nodes = {}
+        self.edges = {}
+        self.records = 0
+        self.build_time = 0
+
+    def node(self, record, key):
+        id = record['id_%s' % key]
+        if id not in self.nodes:
+            self.nodes[id] = self.creator.addNode(record, key, self.args)
+        return self.nodes[id]
+
+    def edge(self, record, key, source, target):
+        id = record['id_%s' % key]
+        pair = (source.id, target.id)
+        done = self.edges.get(id)
+        if done is None:
+            self.edges[id] = {pair}
+            return self.creator.addEdge(record, key, self.args, source, target)
+        if pair not in done:
+            duplicate = len(done)
+            done.add(pair)
+            return self.creator.addEdge(record, key, self.args, source, target, duplicate)
+        return None
+
+    def ingest(self, result, handler):
+        self.creator.setStage('build')
+        start = time.time()
+        for record in result:
+            self.records += 1
+            handler(record)
+        self.build_time += time.time() - start
+        self.creator.stats.update({
+            'records': self.records,
+            'nodes': self.creator.tulip_graph.numberOfNodes(),
+            'edges': self.creator.tulip_graph.numberOfEdges(),
+            'build_time': round(self.build_time, 3)
+        })
+
+
 class CreateTlp(object):
     def __init__(self):
         super(CreateTlp, self).__init__()
@@ -19,10 +69,14 @@ class CreateTlp(object):
         self.property_labels = self.tulip_graph.getStringProperty("labels")
         self.property_color = self.tulip_graph.getColorProperty("viewColor")
         self.property_size = self.tulip_graph.getSizeProperty("viewSize")
-        self.models = []
-        mongo_models = mongo.db['models'].find()
-        for m in mongo_models:
-            self.models.append(m)
+        self.pending_labels = []
+        self.pending_properties = []
+        self.stats = {'label_queries': 0}
+        self.progress = None
+
+    def setStage(self, stage):
+        if self.progress:
+            self.progress(stage)
 
     def create(self, params):
         params = tlp.getDefaultPluginParameters('Planar Graph')
@@ -46,75 +100,73 @@ class CreateTlp(object):
         self.tulip_graph.applyLayoutAlgorithm("FM^3 (OGDF)")
         return self.tulip_graph
 
-    def getLabel(self, id, labels):
-        model = next((model for model in self.models if model['label'] in labels and 'labeling' in model.keys()), None)
-        if model and model['labeling']:
-            # q = "MATCH (n:%s) WHERE ID(n) = %s" % (model['label'], id)
-            q = "MATCH (n)--(:Link:Prop)--(p:Property:%s) WHERE ID(n) = %s" % (model['labeling'], id)
-            q += " RETURN p.value as label"
-            r = neo4j.query_neo4j(q)
-            try:
-                return r.single()['label']
-            except ResultError:
-                return "id: %s" % id
-
-    def getColor(self, labels):
-        for label in eval(labels):
-            for model in self.models:
-                if model['label'] == label and 'color' in model.keys():
-                    color = model['color'].split(',')
-                    return tlp.Color(int(color[0].replace('rgb(', '')), int(color[1]), int(color[2][:-1]))
-        return tlp.Color(49, 130, 189)
-
-    def getProperty(self, id):
-        result = []
-        element = {}
-        query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s" % id
-        query += " OPTIONAL MATCH (l)-->(la:Link:Attr)-->(a:Node)"
-        query += " RETURN labels(p) as labels, p.value as value, ID(p) as pid, collect(id(la)) as laid"
-        result = neo4j.query_neo4j(query)
-        for record in result:
-            label = record['labels']
-            label.remove('Property')
-            if not label[0] in element.keys():
-                element[label[0]] = []
-            prop = {"pid": record['pid'], "value": record['value']}
-            element[label[0]].append(prop)
-
-        ####### Attributes #######
-        attrs = []
-        q = "MATCH (n)-[:HAS]->(:Link:Attr)-[:IS]->(k)"
-        q += " WHERE ID(n) = %s RETURN COLLECT(DISTINCT labels(k)) as attr" % id
-        result = neo4j.query_neo4j(q)
-        attributes = result.single()['attr']
-        for a in attributes:
-            if 'Attribute' in a:
-                a.remove('Attribute')
-            if 'Node' in a:
-                a.remove('Node')
-            if 'Geo' in a:
-                a.remove('Geo')
-            if 'Time' in a:
-                a.remove('Time')
-            if 'SubGraph' in a:
-                a.remove('SubGraph')
-            attrs.append(a[0])  # Unpack
-        if attrs:
-            for attribute in attrs:
-                query = "MATCH (n) WHERE ID(n) = %s" % id
-                query += " WITH n"
-                query += " MATCH (n)-[:HAS]->(l:Link:Attr)-[:IS]->(%s:%s)" % (attribute.replace(':', ''), attribute)
-                # if attribute.split(':')[0] == 'Geo' or attribute.split(':')[0] == 'Time':
-                query += " RETURN l.type as type, collect(DISTINCT ID(l)) as aid%s, collect(DISTINCT ID(%s)) as %s " % (attribute.replace(':', ''), attribute.replace(':', ''), attribute.replace(':', ''))
-                result = neo4j.query_neo4j(query)
+    def resolveLabels(self):
+        # Fill the name of every element built without a label_* column, one UNWIND query per labeling key
+        self.setStage('label')
+        batch_size = config['api'].getint('label_batch_size', 1000)
+        by_labeling = {}
+        for element, id, labels in self.pending_labels:
+            labeling = registry.getLabeling(labels)
+            if labeling:
+                by_labeling.setdefault(labeling, {}).setdefault(id, []).append(element)
+            else:
+                self.property_label[element] = str(labeling)
+        self.pending_labels = []
+        for labeling, elements in by_labeling.items():
+            ids = list(elements.keys())
+            for start in range(0, len(ids), batch_size):
+                q = cypher.Query("UNWIND $ids AS id MATCH (n)--(:Link:Prop)--(p:Property:%s) WHERE ID(n) = id",
+                                 cypher.label(labeling), ids=ids[start:start + batch_size])
+                q.add(" RETURN id, collect(p.value) as labels")
+                result = q.run()
+                self.stats['label_queries'] += 1
                 for record in result:
-                    elements = []
-                    i = 0
-                    for e in record[attribute.replace(':', '')]:
-                        elements.append({'id': e, 'laid': record['aid' + attribute.replace(':', '')][i]})
-                        i += 1
-                    element[attribute + ':' + record['type']] = elements
-        return element
+                    if len(record['labels']) == 1:
+                        for element in elements.pop(record['id']):
+                            self.property_label[element] = str(record['labels'][0])
+            for id, remaining in elements.items():
+                for element in remaining:
+                    self.property_label[element] = "id: %s" % id
+
+    def hydrateProperties(self):
+        # Write the properties and attributes of the pending elements in string properties, for the csv export
+        self.setStage('hydrate')
+        batch_size = config['api'].getint('label_batch_size', 1000)
+        elements = {}
+        for element, id in self.pending_properties:
+            elements.setdefault(id, []).append(element)
+        self.pending_properties = []
+        ids = list(elements.keys())
+        values = {}
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            query = cypher.Query("UNWIND $ids AS id MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = id", ids=chunk)
+            query.add(" RETURN DISTINCT id, ID(p) as pid, labels(p) as labels, p.value as value")
+            result = query.run()
+            self.stats['hydrate_queries'] = self.stats.get('hydrate_queries', 0) + 1
+            for record in result:
+                label = [l for l in record['labels'] if l != 'Property']
+                value = record['value']
+                if isinstance(value, type('')):
+                    value = value.replace("'", " ")
+                values.setdefault(label[0], {}).setdefault(record['id'], []).append(value)
+
+            query = cypher.Query("UNWIND $ids AS id MATCH (n)-[:HAS]->(l:Link:Attr)-[:IS]->(k) WHERE ID(n) = id", ids=chunk)
+            query.add(" RETURN id, labels(k) as labels, l.type as type, collect(DISTINCT ID(k)) as attrs")
+            result = query.run()
+            self.stats['hydrate_queries'] += 1
+            for record in result:
+                label = [l for l in record['labels'] if l not in ('Attribute', 'Node', 'Geo', 'Time', 'SubGraph')]
+                if not label:
+                    continue
+                attrs = values.setdefault(label[0] + ':' + record['type'], {}).setdefault(record['id'], [])
+                attrs.extend(a for a in record['attrs'] if a not in attrs)
+
+        for key, by_id in values.items():
+            property = self.tulip_graph.getStringProperty(key)
+            for id, prop in by_id.items():
+                for element in elements[id]:
+                    property[element] = str(prop)[1:-1]
 
     def addNode(self, record, key, args):
         n = self.tulip_graph.addNode()
@@ -122,27 +174,15 @@ class CreateTlp(object):
         self.property_labels[n] = str(record['labels_%s' % key])
         self.property_size[n] = tlp.Size(4, 4, 4)
         if 'color_%s' % key in args.keys() and args['color_%s' % key]:
-            color = args['color_%s' % key].split(',')
-            self.property_color[n] = tlp.Color(int(color[0].replace('rgb(', '')), int(color[1]), int(color[2][:-1]))
+            self.property_color[n] = parseColor(args['color_%s' % key])
         else:
-            self.property_color[n] = self.getColor(str(record['labels_%s' % key]))
+            self.property_color[n] = registry.getColor(record['labels_%s' % key])
         if 'label_%s' % key in record.keys():
             self.property_label[n] = str(record['label_%s' % key])
         else:
-            self.property_label[n] = str(self.getLabel(record['id_%s' % key], record['labels_%s' % key]))
+            self.pending_labels.append((n, record['id_%s' % key], record['labels_%s' % key]))
         if args['format'] == 'csv' and args['target'] == 'nodes':
-            property = self.getProperty(record['id_%s' % key])
-            for key in property.keys():
-                prop = []
-                for p in property[key]:
-                    if 'value' in p.keys():
-                        if isinstance(p['value'], type('')): 
-                            prop.append(p['value'].replace("'", " "))
-                        else:
-                            prop.append(p['value'])
-                    elif 'id' in p.keys():
-                        prop.append(p['id'])
-                self.tulip_graph[key][n] = str(prop)[1:-1]
+            self.pending_properties.append((n, record['id_%s' % key]))
         return n
 
     def addEdge(self, record, key, args, n1, n2, duplicate=False):
@@ -155,33 +195,22 @@ class CreateTlp(object):
             self.property_id[e] = str(record['id_%s' % key])
         self.property_labels[e] = str(record['labels_%s' % key])
         if 'color_%s' % key in args.keys() and args['color_%s' % key]:
-            color = args['color_%s' % key].split(',')
-            self.property_color[e] = tlp.Color(int(color[0].replace('rgb(', '')), int(color[1]), int(color[2][:-1]))
+            self.property_color[e] = parseColor(args['color_%s' % key])
         else:
-            self.property_color[e] = self.getColor(str(record['labels_%s' % key]))
+            self.property_color[e] = registry.getColor(record['labels_%s' % key])
         if 'label_%s' % key in record.keys() and record['label_%s' % key]:
             self.property_label[e] = str(record['label_%s' % key])
         else:
-            self.property_label[e] = str(self.getLabel(record['id_%s' % key], str(record['labels_%s' % key])))
+            self.pending_labels.append((e, record['id_%s' % key], record['labels_%s' % key]))
         if args['format'] == 'csv' and args['target'] == 'edges':
-            property = self.getProperty(record['id_%s' % key])
-            for key in property.keys():
-                prop = []
-                for p in property[key]:
-                    if 'value' in p.keys():
-                        if isinstance(p['value'], type('')): 
-                            prop.append(p['value'].replace("'", " "))
-                        else:
-                            prop.append(p['value'])
-                    elif 'id' in p.keys():
-                        prop.append(p['id'])
-                self.tulip_graph[key][e] = str(prop)[1:-1]
+            self.pending_properties.append((e, record['id_%s' % key]))
         return e
 
+    @neo4j.in_session
     def createGraphQuery(self, args):
-        query = ""
-        match = ""
-        optional = ""
+        query = cypher.Query()
+        match = cypher.Query()
+        optional = cypher.Query()
         is_optional = False
         n=0
         edges=[]
@@ -189,199 +218,163 @@ class CreateTlp(object):
             property = element.split('->')
             if property[0] and not property[0] == 'AND' and not property[0] == 'OR' and not property[0] == 'NOT':
                 if 'Link' in property[0]:
-                    query += ' MATCH (n%s)-->(e%s:%s)-->(n%s)' % (n - 1, len(edges), property[0], n)
+                    query.add(' MATCH (n%s)-->(e%s:%s)-->(n%s)', n - 1, len(edges), cypher.label(property[0]), n)
                     if len(property) > 1:
                         for p in property[1:]:
                             prop = p.split("=")
                             if not (prop[0] == 'AND' or prop[0] == 'OR'):
-                                query += " MATCH (e%s:%s)" % (len(edges), property[0])
-                                query += '-->(:Prop)-->(:Property:%s {value: "%s"})' % (prop[0], prop[1])
+                                query.add(" MATCH (e%s:%s)", len(edges), cypher.label(property[0]))
+                                query.add('-->(:Prop)-->(:Property:%s {value: ' + match.param(prop[1]) + '})', cypher.label(prop[0]))
                     edges.append({'source': n - 1, 'target': n})
                 else:
                     if len(property) > 1:
                         for p in property[1:]:
                             prop = p.split("=")
                             if not (prop[0] == 'AND' or prop[0] == 'OR'):
-                                query += " MATCH (n%s:%s)" % (n, property[0])
-                                query += '-->(:Prop)-->(:Property:%s {value: "%s"})' % (prop[0], prop[1])
+                                query.add(" MATCH (n%s:%s)", n, cypher.label(property[0]))
+                                query.add('-->(:Prop)-->(:Property:%s {value: ' + match.param(prop[1]) + '})', cypher.label(prop[0]))
                     else:
-                        query += " MATCH (n%s:%s)" % (n, property[0])
+                        query.add(" MATCH (n%s:%s)", n, cypher.label(property[0]))
                     n += 1
                 if is_optional:
-                    optional += ' OPTIONAL' + query
+                    optional.add(' OPTIONAL' + query.text)
                     is_optional = False
                 else:
-                    match += query
-                query = ''
+                    match.add(query.text)
+                query = cypher.Query()
             elif property[0] == 'OR':
                 is_optional = True
 
-        query += match + optional + ' RETURN '
+        returned = []
         for i in range(0, n):
-            query += "ID(n%s) as id_n%s, labels(n%s) as labels_n%s, " % (i, i, i, i)
+            returned.append("ID(n%s) as id_n%s, labels(n%s) as labels_n%s" % (i, i, i, i))
         for i, e in enumerate(edges):
-            query += "ID(e%s) as id_e%s, labels(e%s) as labels_e%s, " % (i, i, i, i)
-        query = query[:-2]
-        print(query)
-        result = neo4j.query_neo4j(query)
+            returned.append("ID(e%s) as id_e%s, labels(e%s) as labels_e%s" % (i, i, i, i))
+        match.add(optional.text + ' RETURN ' + ', '.join(returned))
+        print(match.text)
+        self.setStage('query')
+        result = match.stream()
 
-        nodes_done = {}
-        edges_done = {}
+        ingestor = GraphIngestor(self, args)
 
-        for record in result:
+        def handle(record):
             # Nodes
             for i in range(0, n):
-                if record['id_n%s' % i] and record['id_n%s' % i] not in nodes_done:
-                    nodes_done[record['id_n%s' % i]] = self.addNode(record, 'n%s' % i, args)
+                if record['id_n%s' % i] is not None:
+                    ingestor.node(record, 'n%s' % i)
 
             #  Edges
             for i, e in enumerate(edges):
-                source = nodes_done[record['id_n%s' % e['source']]]
-                target = nodes_done[record['id_n%s' % e['target']]]
-                if record['id_e%s' % i] and record['id_e%s' % i] not in edges_done:
-                    self.addEdge(record, 'e%s' % i, args, source, target)
-                    edges_done[record['id_e%s' % i]] = {'count': 1, 'sources': [source.id], 'targets': [target.id]}
-                elif record['id_e%s' % i] and not (source.id in edges_done[record['id_e%s' % i]]['sources'] and target.id in edges_done[record['id_e%s' % i]]['targets']):
-                    self.addEdge(record, 'e%s' % i, args, source, target, edges_done[record['id_e%s' % i]]['count'])
-                    edges_done[record['id_e%s' % i]]['count'] += 1
-                    edges_done[record['id_e%s' % i]]['sources'].append(source.id)
-                    edges_done[record['id_e%s' % i]]['targets'].append(target.id)
+                if record['id_e%s' % i] is not None:
+                    source = ingestor.nodes[record['id_n%s' % e['source']]]
+                    target = ingestor.nodes[record['id_n%s' % e['target']]]
+                    ingestor.edge(record, 'e%s' % i, source, target)
+
+        ingestor.ingest(result, handle)
+        self.resolveLabels()
+        if self.pending_properties:
+            self.hydrateProperties()
         return self.tulip_graph
 
+    @neo4j.in_session
     def createLabelEdgeLabel(self, params):
         l1, e, l2, args = params
-        query = "MATCH (left:%s)-[]->(edge:%s)-[]->(right:%s) RETURN" % (l1, e, l2)
-        query += " ID(left) as id_left"
-        query += ", ID(edge) as id_edge"
-        query += ", ID(right) as id_right"
-        query += ", labels(left) as labels_left "
-        query += ", labels(edge) as labels_edge "
-        query += ", labels(right) as labels_right "
+        query = cypher.Query("MATCH (left:%s)-[]->(edge:%s)-[]->(right:%s) RETURN",
+                             cypher.label(l1), cypher.label(e), cypher.label(l2))
+        query.add(" ID(left) as id_left")
+        query.add(", ID(edge) as id_edge")
+        query.add(", ID(right) as id_right")
+        query.add(", labels(left) as labels_left ")
+        query.add(", labels(edge) as labels_edge ")
+        query.add(", labels(right) as labels_right ")
         if args['label_key_left']:
-            query += ", left.%s as label_left" % args['label_key_left']
+            query.add(", left.%s as label_left", cypher.key(args['label_key_left']))
         if args['label_key_edge']:
-            query += ", edge.%s as label_edge " % args['label_key_edge']
+            query.add(", edge.%s as label_edge ", cypher.key(args['label_key_edge']))
         if args['label_key_right']:
-            query += ", right.%s as label_right" % args['label_key_right']
-        result = neo4j.query_neo4j(query)
-        nodes_done = {}
-        edges_done = []
+            query.add(", right.%s as label_right", cypher.key(args['label_key_right']))
+        self.setStage('query')
+        result = query.stream()
+        ingestor = GraphIngestor(self, args)
 
-        for record in result:
-            if record['id_left'] not in nodes_done:
-                left = nodes_done[record['id_left']] = self.addNode(record, 'left', args)
-            else:
-                left = nodes_done[record['id_left']]
-            if record['id_right'] not in nodes_done:
-                right = nodes_done[record['id_right']] = self.addNode(record, 'right', args)
-            else:
-                right = nodes_done[record['id_right']]
-            if record['id_edge'] not in edges_done:
-                edge = self.addEdge(record, 'edge', args, left, right)
-                edges_done.append(record['id_edge'])
-            else:
-                edge = self.addEdge(record, 'edge', args, left, right, 1)
+        def handle(record):
+            left = ingestor.node(record, 'left')
+            right = ingestor.node(record, 'right')
+            ingestor.edge(record, 'edge', left, right)
+
+        ingestor.ingest(result, handle)
+        self.resolveLabels()
+        if self.pending_properties:
+            self.hydrateProperties()
         return self.tulip_graph
 
-    def createNeighboursById(self, params):  # todo add level of depth
+    def neighboursReturn(self, query, args):
+        query.add(" RETURN ID(n) as id_target")
+        query.add(", ID(e) as id_edge")
+        query.add(", ID(neigh) as id_neigh")
+        query.add(", labels(n) as labels_target")
+        query.add(", labels(e) as labels_edge")
+        query.add(", labels(neigh) as labels_neigh")
+        if args['label_key_right']:
+            query.add(", neigh.%s as label_neigh", cypher.key(args['label_key_right']))
+        if args['label_key_left']:
+            query.add(", n.%s as label_target", cypher.key(args['label_key_left']))
+        return query
+
+    @neo4j.in_session
+    def createNeighboursById(self, params):
         id, e, label, args = params
-        nodes_done = {}
-        edges_done = {}
+        ingestor = GraphIngestor(self, args)
+        budget = int(args['budget']) if args['budget'] else None
+        self.stats['expand_queries'] = 0
 
-        def execute_query(query, target_to_neigh):
-            result = neo4j.query_neo4j(query)
-            for record in result:
-                if record['id_neigh'] and record['id_target'] not in nodes_done:
-                    t = nodes_done[record['id_target']] = self.addNode(record, 'target', args)
-                else:
-                    t = nodes_done[record['id_target']]
-                if record['id_neigh'] and record['id_neigh'] not in nodes_done:
-                    n = nodes_done[record['id_neigh']] = self.addNode(record, 'neigh', args)
-                else:
-                    n = nodes_done[record['id_neigh']]
-                if record['id_edge'] and record['id_edge'] not in edges_done:
-                    if target_to_neigh:
-                        self.addEdge(record, 'edge', args, n, t)
-                        edges_done[record['id_edge']] = {'source': [t.id], 'target': [n.id], 'count': 1}
-                    else:
-                        self.addEdge(record, 'edge', args, t, n)
-                        edges_done[record['id_edge']] = {'source': [n.id], 'target': [t.id], 'count': 1}
+        def execute_query(query):
+            discovered = []
+
+            def handle(record):
+                if record['id_neigh'] is None:
+                    return
+                if record['id_neigh'] not in ingestor.nodes:
+                    if budget is not None and len(discovered) >= budget:
+                        return
+                    discovered.append(record['id_neigh'])
+                t = ingestor.node(record, 'target')
+                n = ingestor.node(record, 'neigh')
+                if record['incoming']:
+                    ingestor.edge(record, 'edge', n, t)
                 else:
-                    if target_to_neigh and not (t.id in edges_done[record['id_edge']]['source'] and n.id in edges_done[record['id_edge']]['target']):
-                        edges_done[record['id_edge']]['source'].append(t.id)
-                        edges_done[record['id_edge']]['target'].append(n.id)
-                        edges_done[record['id_edge']]['count'] += 1
-                        self.addEdge(record, 'edge', args, n, t, edges_done[record['id_edge']]['count'])
-                    elif not (n.id in edges_done[record['id_edge']]['source'] and t.id in edges_done[record['id_edge']]['target']):
-                        edges_done[record['id_edge']]['source'].append(n.id)
-                        edges_done[record['id_edge']]['target'].append(t.id)
-                        edges_done[record['id_edge']]['count'] += 1
-                        self.addEdge(record, 'edge', args, t, n, edges_done[record['id_edge']]['count'])
-
-
-        query = "MATCH (n) WHERE ID(n) = %s WITH n MATCH (n)-[]->(e:%s)-[]->(neigh:%s)" % (id, e, label)
-        query += " RETURN ID(n) as id_target"
-        query += ", ID(e) as id_edge"
-        query += ", ID(neigh) as id_neigh"
-        query += ", labels(n) as labels_target"
-        query += ", labels(e) as labels_edge"
-        query += ", labels(neigh) as labels_neigh"
-        if args['label_key_right']:
-            query += ", neigh.%s as label_neigh" % args['label_key_right']
-        if args['label_key_left']:
-            query += ", n.%s as label_target" % args['label_key_left']
+                    ingestor.edge(record, 'edge', t, n)
 
+            self.setStage('query')
+            ingestor.ingest(query.stream(), handle)
+            self.stats['expand_queries'] += 1
+            return discovered
 
-        execute_query(query, False)
+        # Breadth first expansion: one round trip per level for the whole frontier, both directions
+        query = cypher.Query("UNWIND $ids AS id MATCH (n) WHERE ID(n) = id WITH n MATCH (n)-[]->(e:%s)-[]->(neigh:%s)",
+                             cypher.label(e), cypher.label(label))
+        self.neighboursReturn(query, args).add(", false as incoming")
+        query.add(" UNION ALL")
+        query.add(" UNWIND $ids AS id MATCH (n) WHERE ID(n) = id WITH n MATCH (n)<-[]-(e:%s)<-[]-(neigh:%s)",
+                  cypher.label(e), cypher.label(label))
+        self.neighboursReturn(query, args).add(", true as incoming")
 
-        query = "MATCH (n) WHERE ID(n) = %s WITH n MATCH (n)<-[]-(e:%s)<-[]-(neigh:%s)" % (id, e, label)
-        query += " RETURN ID(n) as id_target"
-        query += ", ID(e) as id_edge"
-        query += ", ID(neigh) as id_neigh"
-        query += ", labels(n) as labels_target"
-        query += ", labels(e) as labels_edge"
-        query += ", labels(neigh) as labels_neigh"
-        if args['label_key_right']:
-            query += ", neigh.%s as label_neigh" % args['label_key_right']
-        if args['label_key_left']:
-            query += ", n.%s as label_target" % args['label_key_left']
-
-        execute_query(query, True)
-
-        if args['depth']:
-            #  todo correct depth only works when n is same label as neigh
-            i = 1
-            while i < int(args['depth']):
-                i += 1
-                nodes_id = list(nodes_done.keys())
-                for id_neigh in nodes_id:
-                    query = "MATCH (n) WHERE ID(n) = %s WITH n MATCH (n)-[]->(e:%s)-[]->(neigh:%s)" % (id_neigh, e, label)
-                    query += " RETURN ID(n) as id_target"
-                    query += ", ID(e) as id_e, labels(e) as labels_e"
-                    query += ", ID(neigh) as id_neigh, labels(neigh) as label_neigh"
-                    execute_query(query, False)
-
-                    query = "MATCH (n) WHERE ID(n) = %s WITH n MATCH (n)<-[]-(e:%s)<-[]-(neigh:%s)" % (id_neigh, e, label)
-                    query += " RETURN ID(n) as id_target"
-                    query += ", ID(e) as id_e, labels(e) as labels_e"
-                    query += ", ID(neigh) as id_neigh, labels(neigh) as label_neigh"
-                    execute_query(query, True)
-
-        nodes_id = list(nodes_done.keys())
-        for id_neigh in nodes_id:
-            query = "MATCH (n) WHERE ID(n) = %s WITH n " % id_neigh
-            query += "MATCH (n)-[]->(e:%s)-[]->(neigh) WHERE ID(neigh) IN %s" % (e, nodes_id)
-            query += " RETURN ID(n) as id_target"
-            query += ", ID(e) as id_edge"
-            query += ", ID(neigh) as id_neigh"
-            query += ", labels(n) as labels_target"
-            query += ", labels(e) as labels_edge"
-            query += ", labels(neigh) as labels_neigh"
-            if args['label_key_right']:
-                query += ", neigh.%s as label_neigh" % args['label_key_right']
-            if args['label_key_left']:
-                query += ", n.%s as label_target" % args['label_key_left']
-
-            execute_query(query, False)
+        frontier = [id]
+        depth = max(int(args['depth']), 1) if args['depth'] else 1
+        for level in range(depth):
+            query.parameters['ids'] = frontier
+            frontier = execute_query(query)
+            if not frontier:
+                break
+
+        # Closing edges between every collected node
+        if ingestor.nodes:
+            query = cypher.Query("MATCH (n)-[]->(e:%s)-[]->(neigh) WHERE ID(n) IN $ids AND ID(neigh) IN $ids",
+                                 cypher.label(e), ids=list(ingestor.nodes.keys()))
+            self.neighboursReturn(query, args).add(", false as incoming")
+            execute_query(query)
 
+        self.resolveLabels()
+        if self.pending_properties:
+            self.hydrateProperties()
         return self.tulip_graph
@@ -0,0 +1,259 @@
+from collections import OrderedDict
+from connector import mongo
+from pymongo.errors import DocumentTooLarge
+from tulip import tlp
+import configparser
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+
+config = configparser.ConfigParser()
+config.read("config.ini")
+
+SEED = 12345
+# Memory of a cached entry, measured with sys.getsizeof: a [id, [x, y, z]] node, an [id, bends] edge, a bend
+NODE_BYTES = 280
+EDGE_BYTES = 120
+BEND_BYTES = 104
+logger = logging.getLogger(__name__)
+
+
+def entrySize(entry):
+    size = sum(NODE_BYTES + len(id) for id, coord in entry['nodes'])
+    size += sum(EDGE_BYTES + len(id) + BEND_BYTES * len(bends) for id, bends in entry['edges'])
+    return size
+
+
+class LayoutCache(object):
+    """
+    Positions computed by a layout algorithm, keyed by the graph structure and the algorithm.
+    An in memory LRU bounded by an estimated budget in bytes, backed, when persist is set,
+    by the mongo 'layouts' collection. A layout above the whole budget is not kept in memory.
+    """
+    def __init__(self, budget, persist):
+        super(LayoutCache, self).__init__()
+        self.budget = budget
+        self.persist = persist
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.skipped = 0
+        self.oversized = 0
+
+    def key(self, graph, algorithm):
+        property_id = graph.getStringProperty("neo4j_id")
+        nodes = sorted(property_id[node] for node in graph.getNodes())
+        edges = sorted((property_id[edge], property_id[graph.source(edge)], property_id[graph.target(edge)])
+                       for edge in graph.getEdges())
+        h = hashlib.sha1()
+        h.update(('%s|%s|' % (algorithm, SEED)).encode('utf-8'))
+        h.update('\x1f'.join(nodes).encode('utf-8'))
+        h.update(b'|')
+        h.update('\x1f'.join('%s>%s>%s' % edge for edge in edges).encode('utf-8'))
+        return h.hexdigest()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                entry = entry[0]
+        if entry is None and self.persist:
+            document = mongo.db['layouts'].find_one({'_id': key})
+            if document:
+                entry = {'nodes': document['nodes'], 'edges': document['edges']}
+                self.put(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        size = entrySize(entry)
+        with self.lock:
+            if size > self.budget:
+                self.skipped += 1
+                return
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self.entries[key] = (entry, size)
+            self.size += size
+            while self.size > self.budget:
+                evicted_key, evicted = self.entries.popitem(last=False)
+                self.size -= evicted[1]
+                self.evictions += 1
+
+    def restore(self, graph, key):
+        entry = self.get(key)
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return False
+            self.hits += 1
+        property_id = graph.getStringProperty("neo4j_id")
+        layout = graph.getLayoutProperty("viewLayout")
+        nodes = dict((id, coord) for id, coord in entry['nodes'])
+        edges = dict((id, bends) for id, bends in entry['edges'])
+        for node in graph.getNodes():
+            layout[node] = tlp.Coord(*nodes[property_id[node]])
+        for edge in graph.getEdges():
+            layout[edge] = [tlp.Coord(*bend) for bend in edges.get(property_id[edge], [])]
+        return True
+
+    def store(self, graph, key):
+        property_id = graph.getStringProperty("neo4j_id")
+        layout = graph.getLayoutProperty("viewLayout")
+        nodes = []
+        for node in graph.getNodes():
+            c = layout[node]
+            nodes.append([property_id[node], [c.getX(), c.getY(), c.getZ()]])
+        edges = []
+        for edge in graph.getEdges():
+            bends = layout[edge]
+            if bends:
+                edges.append([property_id[edge], [[c.getX(), c.getY(), c.getZ()] for c in bends]])
+        entry = {'nodes': nodes, 'edges': edges}
+        self.put(key, entry)
+        if self.persist:
+            try:
+                mongo.db['layouts'].replace_one({'_id': key}, entry, upsert=True)
+            except DocumentTooLarge:
+                # Past the 16MB of a mongo document: the layout is only kept in memory
+                with self.lock:
+                    self.oversized += 1
+                logger.warning("Layout %s of %s nodes not persisted: document too large", key, len(nodes))
+
+    def getStats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'size': self.size, 'budget': self.budget, 'persist': self.persist,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'skipped': self.skipped, 'oversized': self.oversized}
+
+
+def computeLayout(nb_nodes, edges, algorithm):
+    # Worker process side: rebuild the structure from the compact edge list and return the positions
+    graph = tlp.newGraph()
+    nodes = [graph.addNode() for i in range(nb_nodes)]
+    graph_edges = [graph.addEdge(nodes[source], nodes[target]) for source, target in edges]
+    tlp.setSeedOfRandomSequence(SEED)
+    tlp.initRandomSequence()
+    graph.applyLayoutAlgorithm(algorithm)
+    layout = graph.getLayoutProperty("viewLayout")
+    coords = []
+    for node in nodes:
+        c = layout[node]
+        coords.append((c.getX(), c.getY(), c.getZ()))
+    bends = []
+    for edge in graph_edges:
+        bends.append([(c.getX(), c.getY(), c.getZ()) for c in layout[edge]])
+    return coords, bends
+
+
+class LayoutPool(object):
+    """
+    Run layout algorithms in long lived worker processes, at most `workers` at a time.
+    Each worker is a one process spawn pool, started on first use and reused across jobs, so a worker
+    is never forked from the threaded server. A job waiting for a worker or running past the deadline
+    is dropped, only the worker running it is terminated and replaced, and the caller falls back
+    to a cheaper algorithm.
+    """
+    def __init__(self, workers, queue, timeout, inline_nodes, fallback):
+        super(LayoutPool, self).__init__()
+        self.workers = workers
+        self.queue = queue
+        self.timeout = timeout
+        self.inline_nodes = inline_nodes
+        self.fallback = fallback
+        self.context = multiprocessing.get_context('spawn')
+        self.idle = [None] * workers
+        self.slots = threading.BoundedSemaphore(workers)
+        self.lock = threading.Lock()
+        self.waiting = 0
+        self.running = 0
+        self.jobs = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.started = 0
+        self.recycled = 0
+
+    def acquire(self):
+        with self.lock:
+            worker = self.idle.pop()
+            if worker is None:
+                self.started += 1
+        return worker or self.context.Pool(1)
+
+    def recycle(self, worker):
+        worker.terminate()
+        with self.lock:
+            self.recycled += 1
+
+    def run(self, graph, algorithm):
+        nodes = list(graph.getNodes())
+        index = dict((node.id, i) for i, node in enumerate(nodes))
+        graph_edges = list(graph.getEdges())
+        edges = [(index[graph.source(edge).id], index[graph.target(edge).id]) for edge in graph_edges]
+        with self.lock:
+            if self.waiting >= self.queue:
+                self.rejected += 1
+                return False
+            self.waiting += 1
+        deadline = time.time() + self.timeout
+        acquired = self.slots.acquire(timeout=self.timeout)
+        with self.lock:
+            self.waiting -= 1
+            if not acquired:
+                self.timeouts += 1
+                return False
+            self.running += 1
+            self.jobs += 1
+        worker = None
+        try:
+            worker = self.acquire()
+            job = worker.apply_async(computeLayout, (len(nodes), edges, algorithm))
+            try:
+                coords, bends = job.get(max(deadline - time.time(), 0))
+            except multiprocessing.TimeoutError:
+                # deadline reached, or the worker died and the job will never complete
+                self.recycle(worker)
+                worker = None
+                with self.lock:
+                    self.timeouts += 1
+                return False
+            except Exception:
+                logger.exception("Layout %s of %s nodes failed", algorithm, len(nodes))
+                with self.lock:
+                    self.errors += 1
+                return False
+        finally:
+            with self.lock:
+                self.idle.append(worker)
+                self.running -= 1
+            self.slots.release()
+        layout = graph.getLayoutProperty("viewLayout")
+        for node, coord in zip(nodes, coords):
+            layout[node] = tlp.Coord(*coord)
+        for edge, bend in zip(graph_edges, bends):
+            layout[edge] = [tlp.Coord(*c) for c in bend]
+        return True
+
+    def getStats(self):
+        with self.lock:
+            return {'workers': self.workers, 'queue': self.queue, 'timeout': self.timeout, 'fallback': self.fallback,
+                    'waiting': self.waiting, 'running': self.running, 'jobs': self.jobs,
+                    'rejected': self.rejected, 'timeouts': self.timeouts, 'errors': self.errors,
+                    'started': self.started, 'recycled': self.recycled}
+
+
+layouts = LayoutCache(config.getint('layout', 'cache_mb', fallback=64) * 1024 * 1024,
+                      config.getboolean('layout', 'persist', fallback=False))
+pool = LayoutPool(config.getint('layout', 'workers', fallback=0) or os.cpu_count(),
+                  config.getint('layout', 'queue', fallback=16),
+                  config.getfloat('layout', 'timeout', fallback=30),
+                  config.getint('layout', 'inline_nodes', fallback=500),
+                  config.get('layout', 'fallback', fallback='Circular (OGDF)'))
@@ -0,0 +1,78 @@
+from connector import mongo
+from tulip import tlp
+import configparser
+import threading
+import time
+
+config = configparser.ConfigParser()
+config.read("config.ini")
+
+
+def parseColor(color):
+    color = color.split(',')
+    return tlp.Color(int(color[0].replace('rgb(', '')), int(color[1]), int(color[2][:-1]))
+
+
+class ModelRegistry(object):
+    def __init__(self, ttl):
+        super(ModelRegistry, self).__init__()
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.index = None
+        self.loaded_at = 0
+        self.loads = 0
+
+    def load(self):
+        colors = {}
+        labelings = {}
+        count = 0
+        for position, model in enumerate(mongo.db['models'].find()):
+            count += 1
+            label = model['label']
+            if 'color' in model.keys() and label not in colors:
+                colors[label] = parseColor(model['color'])
+            # keep the position: the first matching model wins, whatever the order of the element labels
+            if 'labeling' in model.keys() and label not in labelings:
+                labelings[label] = (position, model['labeling'])
+        return {'colors': colors, 'labelings': labelings, 'models': count}
+
+    def getIndex(self):
+        index = self.index
+        if index is not None and time.time() - self.loaded_at < self.ttl:
+            return index
+        with self.lock:
+            if self.index is None or time.time() - self.loaded_at >= self.ttl:
+                self.index = self.load()
+                self.loaded_at = time.time()
+                self.loads += 1
+            return self.index
+
+    def invalidate(self):
+        with self.lock:
+            self.index = None
+
+    def getColor(self, labels):
+        colors = self.getIndex()['colors']
+        for label in labels:
+            if label in colors:
+                return colors[label]
+        return tlp.Color(49, 130, 189)
+
+    def getLabeling(self, labels):
+        labelings = self.getIndex()['labelings']
+        matches = [labelings[label] for label in labels if label in labelings]
+        if matches and min(matches)[1]:
+            return min(matches)[1]
+        return None
+
+    def getStats(self):
+        index = self.index
+        return {'models': index['models'] if index else 0,
+                'labels': len(set(index['colors']) | set(index['labelings'])) if index else 0,
+                'loaded': index is not None,
+                'age': time.time() - self.loaded_at if index else None,
+                'ttl': self.ttl,
+                'loads': self.loads}
+
+
+registry = ModelRegistry(config['mongo'].getint('models_ttl', 60))
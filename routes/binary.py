@@ -0,0 +1,146 @@
+"""
+Columnar binary graph format (format=binary), little-endian, every section aligned on 4 bytes.
+
+Header, 24 bytes:
+    magic       4s    b'GRYB'
+    version     u16   1
+    flags       u16   0
+    nodes       u32   N, number of nodes
+    edges       u32   M, number of edges
+    strings     u32   S, number of strings in the string table
+    blob        u32   B, byte size of the utf-8 string blob
+
+Sections, in order:
+    string offsets  u32[S + 1]  string i is blob[offsets[i]:offsets[i + 1]]
+    string blob     u8[B]       utf-8, padded to 4 bytes
+    node ids        u32[N]      string index of the neo4j id
+    node labels     u32[N]      string index of the label
+    node x          f32[N]
+    node y          f32[N]
+    node size       f32[N]
+    node colors     u8[3N]      r, g, b, padded to 4 bytes
+    edge ids        u32[M]      string index of the neo4j id
+    edge labels     u32[M]      string index of the label ('' when none)
+    edge sources    u32[M]      index in the node arrays
+    edge targets    u32[M]      index in the node arrays
+    edge colors     u8[3M]      r, g, b, padded to 4 bytes
+"""
+import struct
+
+MAGIC = b'GRYB'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIII')
+
+
+def pad(data):
+    return data + b'\0' * (-len(data) % 4)
+
+
+class StringTable(object):
+    def __init__(self):
+        super(StringTable, self).__init__()
+        self.index = {}
+        self.strings = []
+
+    def add(self, value):
+        if value not in self.index:
+            self.index[value] = len(self.strings)
+            self.strings.append(value.encode('utf-8'))
+        return self.index[value]
+
+    def pack(self):
+        offsets = [0]
+        for s in self.strings:
+            offsets.append(offsets[-1] + len(s))
+        blob = b''.join(self.strings)
+        return struct.pack('<%dI' % len(offsets), *offsets) + pad(blob), len(blob)
+
+
+def getBinary(graph):
+    property_id = graph.getStringProperty("neo4j_id")
+    property_label = graph.getStringProperty("name")
+    color = graph.getColorProperty("viewColor")
+    size = graph.getSizeProperty("viewSize")
+    layout = graph.getLayoutProperty("viewLayout")
+    layout.center()
+    table = StringTable()
+
+    index = {}
+    node_ids, node_labels, xs, ys, sizes, node_colors = [], [], [], [], [], []
+    for node in graph.getNodes():
+        id = property_id[node]
+        if id in index:
+            continue
+        index[id] = len(node_ids)
+        node_ids.append(table.add(id))
+        node_labels.append(table.add(property_label[node] or "node" + str(node.id)))
+        c = layout[node]
+        xs.append(c.getX())
+        ys.append(c.getY())
+        s = size[node]
+        sizes.append((int(s.getW()) + int(s.getH())) / 2)
+        c = color[node]
+        node_colors.extend((c.getR(), c.getG(), c.getB()))
+
+    seen = set()
+    edge_ids, edge_labels, sources, targets, edge_colors = [], [], [], [], []
+    for edge in graph.getEdges():
+        id = property_id[edge]
+        if id in seen:
+            continue
+        seen.add(id)
+        edge_ids.append(table.add(id))
+        edge_labels.append(table.add(property_label[edge]))
+        sources.append(index[property_id[graph.source(edge)]])
+        targets.append(index[property_id[graph.target(edge)]])
+        c = color[edge]
+        edge_colors.extend((c.getR(), c.getG(), c.getB()))
+
+    strings, blob_size = table.pack()
+    n, m = len(node_ids), len(edge_ids)
+    return b''.join([
+        HEADER.pack(MAGIC, VERSION, 0, n, m, len(table.strings), blob_size),
+        strings,
+        struct.pack('<%dI' % n, *node_ids),
+        struct.pack('<%dI' % n, *node_labels),
+        struct.pack('<%df' % n, *xs),
+        struct.pack('<%df' % n, *ys),
+        struct.pack('<%df' % n, *sizes),
+        pad(bytes(node_colors)),
+        struct.pack('<%dI' % m, *edge_ids),
+        struct.pack('<%dI' % m, *edge_labels),
+        struct.pack('<%dI' % m, *sources),
+        struct.pack('<%dI' % m, *targets),
+        pad(bytes(edge_colors)),
+    ])
+
+
+def decodeBinary(data):
+    # Reference decoder, returns the graph as {"edges": [...], "nodes": [...]} with ids/labels resolved
+    magic, version, flags, n, m, nb_strings, blob_size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a version %s graph-ryder binary graph" % VERSION)
+    offset = [HEADER.size]
+
+    def read(fmt, count, size):
+        values = struct.unpack_from('<%d%s' % (count, fmt), data, offset[0])
+        offset[0] += count * size + (-(count * size) % 4)
+        return values
+
+    offsets = read('I', nb_strings + 1, 4)
+    start = offset[0]
+    strings = [data[start + offsets[i]:start + offsets[i + 1]].decode('utf-8') for i in range(nb_strings)]
+    offset[0] += blob_size + (-blob_size % 4)
+    node_ids, node_labels = read('I', n, 4), read('I', n, 4)
+    xs, ys, sizes = read('f', n, 4), read('f', n, 4), read('f', n, 4)
+    node_colors = read('B', 3 * n, 1)
+    edge_ids, edge_labels = read('I', m, 4), read('I', m, 4)
+    sources, targets = read('I', m, 4), read('I', m, 4)
+    edge_colors = read('B', 3 * m, 1)
+
+    nodes = [{"id": strings[node_ids[i]], "label": strings[node_labels[i]], "x": xs[i], "y": ys[i],
+              "size": sizes[i], "color": 'rgb(%s,%s,%s)' % node_colors[3 * i:3 * i + 3]} for i in range(n)]
+    edges = [{"id": strings[edge_ids[i]], "label": strings[edge_labels[i]],
+              "source": nodes[sources[i]]["id"], "target": nodes[targets[i]]["id"],
+              "color": 'rgb(%s,%s,%s)' % edge_colors[3 * i:3 * i + 3]} for i in range(m)]
+    return {"edges": edges, "nodes": nodes}
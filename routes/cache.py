@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from flask import request, Response
+import configparser
+import functools
+import hashlib
+import threading
+
+config = configparser.ConfigParser()
+config.read("config.ini")
+
+
+class ResponseCache(object):
+    """
+    LRU of final response bodies bounded by a memory budget in bytes.
+    Every invalidation bumps the generation: a response computed before a write is never stored after it.
+    """
+    def __init__(self, budget):
+        super(ResponseCache, self).__init__()
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.size = 0
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry, generation):
+        size = len(entry['body'])
+        if size > self.budget:
+            return
+        with self.lock:
+            if generation != self.generation:
+                return
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous['body'])
+            self.entries[key] = entry
+            self.size += size
+            while self.size > self.budget:
+                evicted_key, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted['body'])
+                self.evictions += 1
+
+    def invalidate(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            self.generation += 1
+            self.invalidations += 1
+
+    def getStats(self):
+        with self.lock:
+            return {'entries': len(self.entries),
+                    'size': self.size,
+                    'budget': self.budget,
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'invalidations': self.invalidations}
+
+
+responses = ResponseCache(config.getint('cache', 'response_cache_mb', fallback=64) * 1024 * 1024)
+
+
+def cacheKey():
+    args = sorted((k, v) for k, v in request.args.items(multi=True) if v)
+    return request.path + '?' + '&'.join('%s=%s' % (k, v) for k, v in args)
+
+
+def cached(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        key = cacheKey()
+        generation = responses.generation
+        entry = responses.get(key)
+        if entry is not None:
+            response = Response(entry['body'], entry['status'], headers=entry['headers'])
+            response.headers['X-Cache'] = 'HIT'
+            return response
+        response = method(*args, **kwargs)
+        if response.status_code == 200 and not response.is_streamed and not response.direct_passthrough:
+            body = response.get_data()
+            response.set_etag(hashlib.sha1(body).hexdigest())
+            responses.put(key, {'body': body,
+                                'status': response.status_code,
+                                'headers': list(response.headers.items())}, generation)
+            response.headers['X-Cache'] = 'MISS'
+        return response
+    return wrapper
+
+
+def invalidating(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            responses.invalidate()
+    return wrapper
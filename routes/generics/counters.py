@@ -1,6 +1,7 @@
 from neo4j.v1 import ResultError
 
-from connector import neo4j
+from connector import cypher
+from connector.labels import stats
 from flask_restful import Resource, reqparse
 from routes.utils import makeResponse, addargs
 
@@ -17,8 +18,8 @@ class CountLabel(Resource):
       @apiSuccess {Integer} result nb of iteration for the label
    """
     def get(self, label):
-        query = "MATCH (n:%s) RETURN COUNT(n) as iteration" % label
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n:%s) RETURN COUNT(n) as iteration", cypher.label(label))
+        result = query.run()
         return makeResponse(result.single()['iteration'], 200)
 
 
@@ -31,9 +32,4 @@ class CountLabels(Resource):
       @apiSuccess {Integer} Array of labels with nb of iteration
    """
     def get(self):
-        query = "MATCH (a) WITH DISTINCT LABELS(a) AS temp, COUNT(a) AS tempCnt UNWIND temp AS label RETURN label, SUM(tempCnt) AS cnt"
-        result = neo4j.query_neo4j(query)
-        labels = {}
-        for record in result:
-            labels[record['label']] = record['cnt']
-        return makeResponse(labels, 200)
+        return makeResponse(stats.getCounts(), 200)
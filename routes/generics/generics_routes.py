@@ -1,6 +1,7 @@
 from routes.generics.getters import *
 from routes.generics.setters import *
 from routes.generics.counters import *
+from routes.generics.importers import *
 
 
 def add_generics_routes(api):
@@ -22,12 +23,16 @@ def add_generics_routes(api):
     # GET Element(s)
     api.add_resource(GetByLabel, '/get/<string:label>')
     api.add_resource(GetById, '/get/<int:id>')
+    api.add_resource(GetByIds, '/getByIds/')
 
     # SET
     api.add_resource(SetById, '/set/<int:id>')
+    api.add_resource(SetDates, '/setDates/')
     api.add_resource(CreateNode, '/createNode/')
     api.add_resource(CreateEdge, '/createEdge/')
+    api.add_resource(Import, '/import/')
     api.add_resource(DeleteById, '/<int:id>')
+    api.add_resource(DeleteByIds, '/deleteByIds/')
 
     # COUNT
     api.add_resource(CountLabels, '/countLabels/')
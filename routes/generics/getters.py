@@ -1,16 +1,19 @@
-from neo4j.v1 import ResultError
-
-from connector import neo4j
+from connector import neo4j, cypher
+from connector.labels import stats
 from flask_restful import Resource, reqparse
 from routes.utils import makeResponse, addargs
 
-import copy
+import configparser
+
+config = configparser.ConfigParser()
+config.read("config.ini")
 
 parser = reqparse.RequestParser()
 parser.add_argument('keys', action='append')
 parser.add_argument('filters', action='append')
 parser.add_argument('attrs', action='append')
 parser.add_argument('hydrate')
+parser.add_argument('ids', type=int, action='append')
 
 
 class GetLabels(Resource):
@@ -23,9 +26,7 @@ class GetLabels(Resource):
       @apiSuccess {Array} result Array of labels
    """
     def get(self):
-        query = "MATCH (n) WITH n UNWIND labels(n) as l RETURN COLLECT(DISTINCT l) as labels"
-        result = neo4j.query_neo4j(query)
-        return makeResponse(result.single()['labels'], 200)
+        return makeResponse(list(stats.getCounts().keys()), 200)
 
 
 class GetLabelsHierarchy(Resource):
@@ -39,27 +40,26 @@ class GetLabelsHierarchy(Resource):
    """
     def get(self):
         struct = {}
-        query = "MATCH (a) WITH DISTINCT LABELS(a) AS temp, COUNT(a) AS tempCnt UNWIND temp AS label " \
-                "RETURN label, SUM(tempCnt) AS cnt"
-        result = neo4j.query_neo4j(query)
+        combos = stats.getCombos()
         counts = {}
-        for record in result:
-            counts[record['label']] = record['cnt']
-        query = "MATCH (n) RETURN DISTINCT labels(n) as labels"
-        result = neo4j.query_neo4j(query)
+        for labels, count in combos.items():
+            for label in labels:
+                counts[label] = counts.get(label, 0) + count
         ungroupableId = 0
-        for record in result:
-            if all(counts[x] == counts[record['labels'][0]] for x in record['labels']): # todo also if 2 over 3 have the same count
-                if len(record['labels']) == 1:
-                    struct[record['labels'][0]] = {}
-                if len(record['labels']) > 1:
+        for labels in combos:
+            if not labels:
+                continue
+            if all(counts[x] == counts[labels[0]] for x in labels): # todo also if 2 over 3 have the same count
+                if len(labels) == 1:
+                    struct[labels[0]] = {}
+                if len(labels) > 1:
                     struct['ungroupable' + str(ungroupableId)] = {}
-                    for label in record['labels']:
+                    for label in labels:
                         struct['ungroupable' + str(ungroupableId)][label] = {}
                     ungroupableId += 1
             else:
                 prev = {}
-                for i, label in enumerate(sorted(record['labels'], key=lambda l: counts[l], reverse=True)):
+                for i, label in enumerate(sorted(labels, key=lambda l: counts[l], reverse=True)):
                     if not i:
                         if label not in struct.keys():
                             struct[label] = {}
@@ -85,8 +85,9 @@ class GetLabelsByLabel(Resource):
       ["Link", "Locate", "Acquaintance", "Financial", "Event", "Action", "Blood", "Sexual", "Support"]
    """
     def get(self, label):
-        query = "MATCH (n:%s) WITH n UNWIND labels(n) as l RETURN COLLECT(DISTINCT l) as labels" % label
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n:%s) WITH n UNWIND labels(n) as l RETURN COLLECT(DISTINCT l) as labels",
+                             cypher.label(label))
+        result = query.run()
         return makeResponse(result.single()['labels'], 200)
 
 
@@ -104,8 +105,9 @@ class GetLabelsById(Resource):
        ["Link", "Locate"]
     """
     def get(self, id):
-        query = "MATCH (n) WHERE ID(n) = %s WITH n UNWIND labels(n) as l RETURN COLLECT(DISTINCT l) as labels" % id
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n) WHERE ID(n) = $id WITH n UNWIND labels(n) as l RETURN COLLECT(DISTINCT l) as labels",
+                             id=id)
+        result = query.run()
         return makeResponse(result.single()['labels'], 200)
 
 
@@ -119,8 +121,9 @@ class GetPropertiesByLabel(Resource):
        @apiSuccess {Array} result Array of property.
     """
     def get(self, label):
-        query = "MATCH (n:%s)-->(:Link:Prop)-->(p:Property) WITH p UNWIND labels(p) as k RETURN COLLECT(DISTINCT k) as keys" % label
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n:%s)-->(:Link:Prop)-->(p:Property) WITH p UNWIND labels(p) as k RETURN COLLECT(DISTINCT k) as keys",
+                             cypher.label(label))
+        result = query.run()
         keys = result.single()['keys']
         if 'Property' in keys:
             keys.remove('Property')
@@ -138,8 +141,9 @@ class GetAttributesByLabel(Resource):
     """
     def get(self, label):
         # query = "MATCH (n:%s)--(:Link:Attr)--(a:Attribute) WITH a UNWIND labels(a) as k RETURN COLLECT(DISTINCT k) as attr" % label # todo reset when Geo and Time is manage
-        query = "MATCH (n:%s)--(:Link:Attr)--(a) WITH a UNWIND labels(a) as k RETURN COLLECT(DISTINCT k) as attr" % label
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n:%s)--(:Link:Attr)--(a) WITH a UNWIND labels(a) as k RETURN COLLECT(DISTINCT k) as attr",
+                             cypher.label(label))
+        result = query.run()
         attr = result.single()['attr']
         if 'Node' in attr:
             attr.remove('Node')
@@ -175,8 +179,9 @@ class GetPropertyValue(Resource):
        @apiSuccess {Array} result Array of value.
     """
     def get(self, key):
-        query = "MATCH (n)--(:Link:Prop)--(p:Property:%s) WITH p UNWIND p.value as v RETURN COLLECT(DISTINCT v) as values" % key
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n)--(:Link:Prop)--(p:Property:%s) WITH p UNWIND p.value as v RETURN COLLECT(DISTINCT v) as values",
+                             cypher.label(key))
+        result = query.run()
         return makeResponse(result.single()['values'], 200)
 
 
@@ -191,8 +196,9 @@ class GetPropertyValueByLabel(Resource):
        @apiSuccess {Array} result Array of value.
     """
     def get(self, label, key):
-        query = "MATCH (n:%s)--(:Link:Prop)--(p:Property:%s) WITH p UNWIND p.value as v RETURN COLLECT(DISTINCT v) as values" % (label, key)
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n:%s)--(:Link:Prop)--(p:Property:%s) WITH p UNWIND p.value as v RETURN COLLECT(DISTINCT v) as values",
+                             cypher.label(label), cypher.label(key))
+        result = query.run()
         return makeResponse(result.single()['values'], 200)
 
 
@@ -207,8 +213,9 @@ class GetPropertyValueAndIdByLabel(Resource):
        @apiSuccess {Array} result Array of value.
     """
     def get(self, label, key):
-        query = "MATCH (n:%s)--(:Link:Prop)--(p:Property:%s) RETURN p.value as value, id(n) as id" % (label, key)
-        result = neo4j.query_neo4j(query)
+        query = cypher.Query("MATCH (n:%s)--(:Link:Prop)--(p:Property:%s) RETURN p.value as value, id(n) as id",
+                             cypher.label(label), cypher.label(key))
+        result = query.run()
         response = []
         for record in result:
             response.append({'value': record['value'], 'id': record['id']})
@@ -228,26 +235,26 @@ class GetByLabel(Resource):  # todo convert date node to readable date when hydr
        @apiParam {Filters} filter Filters on property
        @apiSuccess {Array} result Array of element.
     """
+    @neo4j.in_session
     def get(self, label): # todo redo for float version
         args = parser.parse_args()
         keys = args['keys']
         filters = args['filters']
-        query = "MATCH (n:%s)" % label
+        query = cypher.Query("MATCH (n:%s)", cypher.label(label))
         if filters:
-            query += "WHERE"
-            for filter in filters:
-                query += " n.%s = '%s' AND" % (filter.split(':')[0], filter.split(':')[1])
-            query = query[:-4]
-        query += " RETURN ID(n) as id"
+            for i, filter in enumerate(filters):
+                query.add(" AND" if i else " WHERE")
+                query.add(" n.%s = " + query.param(filter.split(':')[1]), cypher.key(filter.split(':')[0]))
+        query.add(" RETURN ID(n) as id")
         if keys:
             if '*' in keys:
-                q = "MATCH (n:%s) WITH n UNWIND keys(n) as k RETURN COLLECT(DISTINCT k) as keys" % label
-                result = neo4j.query_neo4j(q)
-                keys = result.single()['keys']
+                q = cypher.Query("MATCH (n:%s) WITH n UNWIND keys(n) as k RETURN COLLECT(DISTINCT k) as keys",
+                                 cypher.label(label))
+                keys = q.run().single()['keys']
             for key in keys:
-                query += ", n.%s as %s" % (key, key)
-        query += addargs()
-        result = neo4j.query_neo4j(query)
+                query.add(", n.%s as %s", cypher.key(key), cypher.key(key))
+        addargs(query)
+        result = query.run()
         response = {}
         for record in result:
             if not record['id'] in response.keys():
@@ -258,49 +265,92 @@ class GetByLabel(Resource):  # todo convert date node to readable date when hydr
         attrs = args['attrs']
         if attrs and '*' in attrs:
             attrs = []
-            q = "MATCH (n:%s)-[:HAS]->(:Property)-[:IS]->(k)" % label
-            q += " RETURN COLLECT(DISTINCT labels(k)) as attr"
-            result = neo4j.query_neo4j(q)
-            attributes = result.single()['attr']
+            q = cypher.Query("MATCH (n:%s)-[:HAS]->(:Property)-[:IS]->(k)", cypher.label(label))
+            q.add(" RETURN COLLECT(DISTINCT labels(k)) as attr")
+            attributes = q.run().single()['attr']
             for a in attributes:
                 if 'Attribute' in a:
                     a.remove('Attribute')
                 attrs.append(a[0])  # Unpack
         if attrs:
             for attribute in attrs:
-                query = "MATCH (n:%s)" % label
-                query += " WITH n"
-                query += " MATCH (n)-[:HAS]->(:Property)-[:IS]->(%s:%s)" % (attribute, attribute)
-                query += " RETURN ID(n) as id, collect(DISTINCT ID(%s)) as %s " % (attribute, attribute)
-                result = neo4j.query_neo4j(query)
+                query = cypher.Query("MATCH (n:%s)", cypher.label(label))
+                query.add(" WITH n")
+                query.add(" MATCH (n)-[:HAS]->(:Property)-[:IS]->(a:%s)", cypher.label(attribute))
+                query.add(" RETURN ID(n) as id, collect(DISTINCT ID(a)) as attr")
+                result = query.run()
+                hydrate = args['hydrate'] and args['hydrate'] != str(0)
+                if hydrate:
+                    # Property maps of every attribute node of this label, in one round trip
+                    ids = list(set(a for record in result for a in record['attr']))
+                    q = cypher.Query("UNWIND $ids AS id MATCH (a:%s) WHERE ID(a) = id RETURN id, a", cypher.label(attribute),
+                                     ids=ids)
+                    hydrated = {}
+                    for record in q.run():
+                        hydrated[record['id']] = {'id': record['id']}
+                        hydrated[record['id']].update(record['a'].properties)
                 for record in result:
                     if not record['id'] in response.keys():
                         response[record['id']] = {}
-                    if not args['hydrate'] or args['hydrate'] == str(0):
-                        response[record['id']][attribute] = record[attribute]
+                    if not hydrate:
+                        response[record['id']][attribute] = record['attr']
                     else:
-                        response[record['id']][attribute] = []
-                        for a in record[attribute]:
-                            q = "MATCH (n) WHERE ID(n) = %s WITH n UNWIND keys(n) as k" % a
-                            q += " RETURN COLLECT(DISTINCT k) as keys"
-                            result = neo4j.query_neo4j(q)
-                            keys = result.single()['keys']
-                            query = "MATCH (n) WHERE ID(n) = %s RETURN ID(n) as id" % a
-                            for key in keys:
-                                query += ", n.%s as %s" % (key, key)
-                            result = neo4j.query_neo4j(query)
-                            try:
-                                res = result.single()
-                            except ResultError:
-                                return makeResponse("Impossible to find this id", 400)
-                            attr = {'id': res['id']}
-                            if keys:
-                                for key in keys:
-                                    attr[key] = res[key]
-                            response[record['id']][attribute].append(attr)
+                        response[record['id']][attribute] = [hydrated[a] for a in record['attr'] if a in hydrated]
         return makeResponse(response, 200)
 
 
+ATTRIBUTE_LABELS = ('Attribute', 'Node', 'Geo', 'Time', 'SubGraph')
+
+
+def elementQuery(keys, attrs):
+    # Properties with their attribute links and typed attributes of the elements $ids, in one statement
+    query = cypher.Query("UNWIND $ids AS id MATCH (n) WHERE ID(n) = id")
+    if keys:
+        query.add(" OPTIONAL MATCH (n)--(l:Link:Prop)--(p:Property)")
+        if '*' not in keys:
+            query.add(" WHERE ANY(k IN labels(p) WHERE k IN $keys)", keys=keys)
+        query.add(" OPTIONAL MATCH (l)-->(la:Link:Attr)-->(pa:Node)")
+        query.add(" WITH n, p, collect(DISTINCT CASE WHEN la IS NULL THEN NULL")
+        query.add(" ELSE {type: la.type, aid: ID(pa), laid: ID(la)} END) AS attrs")
+        query.add(" WITH n, collect(CASE WHEN p IS NULL THEN NULL")
+        query.add(" ELSE {labels: labels(p), value: p.value, pid: ID(p), attrs: attrs} END) AS properties")
+    else:
+        query.add(" WITH n, [] AS properties")
+    if attrs:
+        query.add(" OPTIONAL MATCH (n)-[:HAS]->(l:Link:Attr)-[:IS]->(a)")
+        query.add(" WITH n, properties, collect(DISTINCT CASE WHEN a IS NULL THEN NULL")
+        query.add(" ELSE {type: l.type, laid: ID(l), aid: ID(a), labels: labels(a)} END) AS attributes")
+    else:
+        query.add(" WITH n, properties, [] AS attributes")
+    query.add(" RETURN ID(n) as id, properties, attributes")
+    return query
+
+
+def buildElement(record, attrs):
+    element = {'id': record['id']}
+    for prop in record['properties']:
+        label = [l for l in prop['labels'] if l != 'Property']
+        value = {"pid": prop['pid'], "value": prop['value']}
+        if prop['attrs']:
+            value['attrs'] = [{'type': a['type'], 'aid': a['aid']} for a in prop['attrs']]
+        element.setdefault(label[0], []).append(value)
+    if attrs and '*' in attrs:
+        attrs = []
+        for a in record['attributes']:
+            label = [l for l in a['labels'] if l not in ATTRIBUTE_LABELS]
+            if label and label[0] not in attrs:
+                attrs.append(label[0])
+    for attribute in attrs or []:
+        wanted = set(cypher.label(attribute).split(':'))
+        by_type = {}
+        for a in record['attributes']:
+            if wanted.issubset(a['labels']):
+                by_type.setdefault(a['type'], []).append({'id': a['aid'], 'laid': a['laid']})
+        for type, elements in by_type.items():
+            element[attribute + ':' + type] = elements
+    return element
+
+
 class GetById(Resource):
     """
        @api {get} /get/:id Get an element by id 
@@ -313,118 +363,39 @@ class GetById(Resource):
        @apiParam {hydrate} hydrate != 0 to hydrate attrs with info
        @apiSuccess {Element} the element
     """
-    def get(self, id):  # Multiple request
+    def get(self, id):
         args = parser.parse_args()
-        ####### Properties #######
-        keys = args['keys']
-        result = []
-        query = "MATCH (n) WHERE ID(n) = %s RETURN labels(n) as labels" % id
-        labels = neo4j.query_neo4j(query).single()['labels']
-        element = {'id': id}
-        # ### Time ###
-        # if 'Time' in labels and keys:
-        #     query = "MATCH (t:Time)<-[:CHILD]-(p1) WHERE ID(t) = %s OPTIONAL MATCH (p1)<-[:CHILD]-(p2:Time) " % id
-        #     query += " RETURN t.value as t, ID(t) as tid, labels(t) as labels_t, p1.value as p1, ID(p1) as p1id, labels(p1) as labels_p1, p2.value as p2, ID(p2) as p2id, labels(p2) as labels_p2"
-        #     result = neo4j.query_neo4j(query).single()
-        #     result['labels_t'].remove('Time')
-        #     result['labels_t'].remove('Node')
-        #     element[result['labels_t'][0]] = [{'pid': result['tid'], 'value': result['t']}]
-        #     if result['p1']:
-        #         result['labels_p1'].remove('Time')
-        #         result['labels_p1'].remove('Node')
-        #         element[result['labels_p1'][0]] = [{'pid': result['p1id'], 'value': result['p1']}]
-        #         if result['p2']:
-        #             result['labels_p2'].remove('Time')
-        #             result['labels_p2'].remove('Node')
-        #             element[result['labels_p2'][0]] = [{'pid': result['p2id'], 'value': result['p2']}]
-        #
-        # ### Geo ###
-        # elif 'Geo' in labels and keys:
-        #     print(labels)
-        # else:
-        if keys:
-            query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s" % id
-            if '*' not in keys:
-                query += " AND ('%s' IN labels(p)" % keys.pop(0)
-                for key in keys:
-                    query += " OR '%s' IN labels(p)" % key
-                query += ')'
-            query += " OPTIONAL MATCH (l)-->(la:Link:Attr)-->(a:Node)"
-            query += " RETURN labels(p) as labels, p.value as value, ID(p) as pid, collect(id(la)) as laid"
-            result = neo4j.query_neo4j(query)
-            if not result:
-                return makeResponse("Impossible to find this id", 400)
-        for record in result:
-            label = record['labels']
-            label.remove('Property')
-            if not label[0] in element.keys():
-                element[label[0]] = []
-            prop = {"pid": record['pid'], "value": record['value']}
-            if record['laid']:
-                prop['attrs'] = []
-                for r in record['laid']:
-                    q = "MATCH (la:Link:Attr)-->(a:Node) WHERE ID(la) = %s RETURN la.type as type, ID(a) as aid" % r
-                    result = neo4j.query_neo4j(q)
-                    for rec in result:
-                        prop['attrs'].append({'type': rec['type'], 'aid': rec['aid']})
-            element[label[0]].append(prop)
+        query = elementQuery(args['keys'], args['attrs'])
+        query.parameters['ids'] = [id]
+        result = list(query.run())
+        if not result:
+            return makeResponse("Impossible to find this id", 400)
+        return makeResponse(buildElement(result[0], args['attrs']), 200)
+
+
+class GetByIds(Resource):
+    """
+       @api {get} /getByIds/ Get elements by ids
+       @apiName GetByIds
+       @apiGroup Getters
+       @apiDescription Get many elements by neo4j id with one query, at most api.max_batch_ids ids (also as POST json)
+       @apiParam {ids} ids ids of the elements
+       @apiParam {keys} keys Keys wanted for each property of the element (* for all)
+       @apiParam {attrs} attr attributes wanted for each element (* for all)
+       @apiSuccess {Object} result id to element, null for the unknown ids
+    """
+    def get(self):
         args = parser.parse_args()
+        ids = args['ids'] or []
+        max_ids = config['api'].getint('max_batch_ids', 500)
+        if len(ids) > max_ids:
+            return makeResponse("Too many ids, at most %s" % max_ids, 400)
+        query = elementQuery(args['keys'], args['attrs'])
+        query.parameters['ids'] = list(set(ids))
+        response = dict((id, None) for id in ids)
+        for record in query.run():
+            response[record['id']] = buildElement(record, args['attrs'])
+        return makeResponse(response, 200)
 
-        ####### Attributes #######
-        attrs = args['attrs']
-        if attrs and '*' in attrs:
-            attrs = []
-            q = "MATCH (n)-[:HAS]->(:Link:Attr)-[:IS]->(k)"
-            q += " WHERE ID(n) = %s RETURN COLLECT(DISTINCT labels(k)) as attr" % id
-            result = neo4j.query_neo4j(q)
-            attributes = result.single()['attr']
-            for a in attributes:
-                if 'Attribute' in a:
-                    a.remove('Attribute')
-                if 'Node' in a:
-                    a.remove('Node')
-                if 'Geo' in a:
-                    a.remove('Geo')
-                if 'Time' in a:
-                    a.remove('Time')
-                if 'SubGraph' in a:
-                    a.remove('SubGraph')
-                attrs.append(a[0])  # Unpack
-        if attrs:
-            for attribute in attrs:
-                query = "MATCH (n) WHERE ID(n) = %s" % id
-                query += " WITH n"
-                query += " MATCH (n)-[:HAS]->(l:Link:Attr)-[:IS]->(%s:%s)" % (attribute.replace(':', ''), attribute)
-                # if attribute.split(':')[0] == 'Geo' or attribute.split(':')[0] == 'Time':
-                query += " RETURN l.type as type, collect(DISTINCT ID(l)) as aid%s, collect(DISTINCT ID(%s)) as %s " % (attribute.replace(':', ''), attribute.replace(':', ''), attribute.replace(':', ''))
-                result = neo4j.query_neo4j(query)
-                for record in result:
-                    elements = []
-                    i = 0
-                    for e in record[attribute.replace(':', '')]:
-                        elements.append({'id': e, 'laid': record['aid' + attribute.replace(':', '')][i]})
-                        i += 1
-                    element[attribute + ':' + record['type']] = elements
-                # else:
-                #     query += " RETURN collect(DISTINCT ID(%s)) as %s " % (attribute.replace(':', ''), attribute.replace(':', ''))
-                #     result = neo4j.query_neo4j(query)
-                #     try:
-                #         res = result.single()
-                #     except ResultError:
-                #         return makeResponse("Impossible to find this id", 400)
-                #     # if not args['hydrate'] or args['hydrate'] == 0:
-                #     element[attribute] = res[attribute]
-                    # else:
-                    #     element[attribute] = []
-                    #     for a in res[attribute]:
-                    #         q = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s RETURN labels(p) as labels, p.value as value, ID(p) as pid" % a
-                    #         result = neo4j.query_neo4j(q)
-                    #         attr = {}
-                    #         for record in result:
-                    #             label = record['labels']
-                    #             label.remove('Property')
-                    #             if label[0] not in attr.keys():
-                    #                 attr[label[0]] = []
-                    #             attr[label[0]].append({'value': record['value'], 'pid': record['pid']})
-                    #         element[attribute].append({a: attr})
-        return makeResponse(element, 200)
+    def post(self):
+        return self.get()
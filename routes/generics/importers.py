@@ -0,0 +1,276 @@
+import configparser
+import json
+import time
+
+from flask import request
+from flask_restful import Resource
+from neo4j.v1.exceptions import CypherError
+
+from connector import neo4j, cypher
+from connector.labels import stats
+from routes.utils import makeResponse
+from routes.cache import invalidating
+from routes.generics.setters import setDates, parseDate
+
+config = configparser.ConfigParser()
+config.read("config.ini")
+
+
+class RowError(Exception):
+    pass
+
+
+class BulkImport(object):
+    """
+    Import of nodes and reified edges by chunks of `batch_size` rows. Each chunk is written in its own write
+    transaction with a few UNWIND statements: one per label set, one per property key, one for the attributes.
+    Rows reference each other with client temporary ids ("tmp"): a string source, target or aid is the
+    temporary id of a previous row, an integer is an existing neo4j id.
+    """
+    def __init__(self, batch_size, max_errors=1000):
+        super(BulkImport, self).__init__()
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.ids = {}
+        self.tmps = set()
+        self.counts = {'rows': 0, 'nodes': 0, 'edges': 0, 'properties': 0, 'attributes': 0, 'chunks': 0}
+        self.errors = []
+        self.error_count = 0
+        self.start = time.time()
+
+    def error(self, index, row, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': index, 'tmp': row.get('tmp') if isinstance(row, dict) else None,
+                                'error': message})
+
+    def resolve(self, ref, created):
+        if isinstance(ref, int) and not isinstance(ref, bool):
+            return ref
+        if isinstance(ref, str):
+            if ref in created:
+                return created[ref]
+            if ref in self.ids:
+                return self.ids[ref]
+        raise RowError("Unknown temporary id %r" % (ref,))
+
+    def parse(self, row):
+        if isinstance(row, RowError):
+            raise row
+        if not isinstance(row, dict):
+            raise RowError("A row must be an object")
+        if 'tmp' in row and (not isinstance(row['tmp'], str) or row['tmp'] in self.tmps):
+            raise RowError("Temporary id must be a new string")
+        kind = row.get('kind', 'edge' if 'source' in row else 'node')
+        if kind not in ('node', 'edge'):
+            raise RowError("Unknown kind %r" % (kind,))
+        if kind == 'edge' and ('source' not in row or 'target' not in row):
+            raise RowError("An edge needs a source and a target")
+        labels = row.get('labels')
+        if not labels or not isinstance(labels, list):
+            raise RowError("Labels are missing")
+        properties = []
+        for key, values in (row.get('properties') or {}).items():
+            for value in values if isinstance(values, list) else [values]:
+                properties.append((cypher.label(key), value))
+        attributes = row.get('attributes') or []
+        for attribute in attributes:
+            if not isinstance(attribute, dict) or 'aid' not in attribute or 'type' not in attribute:
+                raise RowError("An attribute needs an aid and a type")
+            if 'Time' in str(attribute['aid']):
+                try:
+                    parseDate(attribute['aid'])
+                except ValueError:
+                    raise RowError("Invalid date %s" % attribute['aid'])
+        labels = cypher.label(':'.join(labels))
+        if 'tmp' in row:
+            self.tmps.add(row['tmp'])
+        return {'kind': kind, 'labels': labels, 'properties': properties,
+                'attributes': attributes, 'source': row.get('source'), 'target': row.get('target'),
+                'tmp': row.get('tmp')}
+
+    def run(self, rows):
+        chunk = []
+        for row in rows:
+            index = self.counts['rows']
+            self.counts['rows'] += 1
+            try:
+                chunk.append((index, row, self.parse(row)))
+            except (RowError, cypher.InvalidIdentifier) as e:
+                self.error(index, row, getattr(e, 'description', None) or str(e))
+            if len(chunk) >= self.batch_size:
+                self.write(chunk)
+                chunk = []
+        if chunk:
+            self.write(chunk)
+        return self.getSummary()
+
+    def write(self, chunk):
+        created = {}
+        elements = {}
+        failed = {}
+        deltas = {}
+        try:
+            with neo4j.write_transaction():
+                self.createElements(chunk, 'node', created, elements, failed)
+                self.createElements(chunk, 'edge', created, elements, failed)
+                properties = self.createProperties(chunk, elements, deltas)
+                attributes, dates = self.createAttributes(chunk, created, elements, failed, deltas)
+        except CypherError as e:
+            for index, row, element in chunk:
+                self.error(index, row, "Chunk rolled back: %s" % e)
+            return
+        finally:
+            self.counts['chunks'] += 1
+        self.ids.update(created)
+        for index, row, element in chunk:
+            if index in elements:
+                self.counts[element['kind'] + 's'] += 1
+                stats.add(element['labels'].split(':'))
+            if index in failed:
+                self.error(index, row, failed[index])
+        self.counts['properties'] += properties
+        self.counts['attributes'] += attributes
+        for labels, count in deltas.items():
+            stats.add(labels, count)
+        # The time tree nodes labeled by setDates are not counted
+        if dates:
+            stats.invalidate()
+
+    def createElements(self, chunk, kind, created, elements, failed):
+        by_labels = {}
+        for index, row, element in chunk:
+            if element['kind'] != kind:
+                continue
+            params = {'index': index}
+            if kind == 'edge':
+                try:
+                    params['source'] = self.resolve(element['source'], created)
+                    params['target'] = self.resolve(element['target'], created)
+                except RowError as e:
+                    failed[index] = str(e)
+                    continue
+            by_labels.setdefault(element['labels'], []).append((params, element))
+        for labels, rows in by_labels.items():
+            if kind == 'node':
+                query = cypher.Query("UNWIND $rows AS row CREATE (n:%s)", labels)
+            else:
+                query = cypher.Query("UNWIND $rows AS row MATCH (s) WHERE ID(s) = row.source MATCH (t) WHERE ID(t) = row.target")
+                query.add(" CREATE (s)-[:LINK]->(n:%s)-[:LINK]->(t)", labels)
+            query.add(" RETURN row.index AS index, ID(n) AS id", rows=[params for params, element in rows])
+            ids = dict((record['index'], record['id']) for record in query.run())
+            for params, element in rows:
+                if params['index'] not in ids:
+                    failed[params['index']] = "Source or target not found"
+                    continue
+                elements[params['index']] = ids[params['index']]
+                if element['tmp']:
+                    created[element['tmp']] = ids[params['index']]
+
+    def addDelta(self, deltas, labels, count):
+        if count:
+            key = tuple(sorted(labels))
+            deltas[key] = deltas.get(key, 0) + count
+
+    def createProperties(self, chunk, elements, deltas):
+        by_key = {}
+        for index, row, element in chunk:
+            if index in elements:
+                for key, value in element['properties']:
+                    by_key.setdefault(key, []).append({'id': elements[index], 'value': value})
+        count = 0
+        for key, rows in by_key.items():
+            query = cypher.Query("UNWIND $rows AS row MATCH (n) WHERE ID(n) = row.id", rows=rows)
+            query.add(" MERGE (p:Property:%s {value: row.value})", key)
+            query.add(" CREATE (n)-[:HAS]->(:Link:Prop)-[:IS]->(p) RETURN count(*) AS created")
+            result = query.run()
+            links = result.single()['created']
+            count += links
+            # One Link:Prop per row, the other nodes created are the merged properties that did not exist
+            self.addDelta(deltas, ['Link', 'Prop'], links)
+            self.addDelta(deltas, ['Property'] + key.split(':'), result.consume().counters.nodes_created - links)
+        return count
+
+    def createAttributes(self, chunk, created, elements, failed, deltas):
+        rows = []
+        dates = []
+        for index, row, element in chunk:
+            if index not in elements:
+                continue
+            for attribute in element['attributes']:
+                if 'Time' in str(attribute['aid']):
+                    dates.append((index, {'target': elements[index], 'type': attribute['type'], 'aid': attribute['aid']}))
+                    continue
+                try:
+                    aid = self.resolve(attribute['aid'], created)
+                except RowError as e:
+                    failed[index] = str(e)
+                    continue
+                rows.append({'index': len(rows), 'row': index, 'id': elements[index], 'aid': aid, 'type': attribute['type']})
+        count = 0
+        if rows:
+            query = cypher.Query("UNWIND $rows AS row MATCH (n) WHERE ID(n) = row.id MATCH (a:Node:Attribute) WHERE ID(a) = row.aid",
+                                 rows=rows)
+            query.add(" MERGE (n)-[:HAS]->(:Link:Attr {type: row.type})-[:IS]->(a) RETURN row.index AS index")
+            result = query.run()
+            done = set(record['index'] for record in result)
+            count += len(done)
+            self.addDelta(deltas, ['Link', 'Attr'], result.consume().counters.nodes_created)
+            for row in rows:
+                if row['index'] not in done:
+                    failed[row['row']] = "Attribute %s not found" % row['aid']
+        if dates:
+            attached = setDates([date for index, date in dates])
+            count += len(attached)
+            for i, (index, date) in enumerate(dates):
+                if i not in attached:
+                    failed[index] = "Date %s not attached" % date['aid']
+        return count, len(dates)
+
+    def getSummary(self):
+        elapsed = time.time() - self.start
+        summary = dict(self.counts)
+        summary.update({'seconds': round(elapsed, 3),
+                        'rowsPerSecond': round(self.counts['rows'] / elapsed, 1) if elapsed else None,
+                        'ids': self.ids,
+                        'errorCount': self.error_count,
+                        'errors': sorted(self.errors, key=lambda e: e['row'])})
+        return summary
+
+
+def readRows():
+    # A JSON array, or one JSON object per line (NDJSON) read from the request stream
+    if request.mimetype == 'application/json':
+        rows = request.get_json()
+        if not isinstance(rows, list):
+            rows = [RowError("The body must be an array of rows")]
+        for row in rows:
+            yield row
+        return
+    for line in request.stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line.decode('utf-8'))
+        except ValueError as e:
+            yield RowError("Invalid json: %s" % e)
+
+
+class Import(Resource):
+    @invalidating
+    def post(self):
+        """
+          @api {post} /import/ Bulk import
+          @apiName Import
+          @apiGroup Setters
+          @apiDescription Create nodes and reified edges in bulk, from a JSON array (application/json) or NDJSON
+          (one row per line). A row is {"kind": "node" or "edge", "tmp": temporary id, "labels": [...],
+          "properties": {key: value or [values]}, "attributes": [{"type": type, "aid": id or "Time:dd/mm/yyyy"}]}
+          and an edge row also has a "source" and a "target". A string source, target or aid is the temporary
+          id of a previous row, an integer an existing neo4j id. Rows are written by chunks of
+          api.import_batch_size, each chunk in one transaction.
+          @apiSuccess {Object} summary counts, throughput, temporary id to neo4j id, errors by row
+       """
+        importer = BulkImport(config['api'].getint('import_batch_size', 1000))
+        return makeResponse(importer.run(readRows()), 200)
@@ -1,9 +1,13 @@
 from neo4j.v1 import ResultError
+from neo4j.v1.exceptions import CypherError
 
-from connector import neo4j
+from connector import neo4j, cypher
+from connector.labels import stats
 from flask_restful import Resource, reqparse, request
 from routes.utils import makeResponse
+from routes.cache import invalidating
 
+import calendar
 import time
 
 parser = reqparse.RequestParser()
@@ -11,107 +15,274 @@ parser.add_argument('keys', action='append')
 parser.add_argument('filters', action='append')
 
 
+# Resolution names of the graphaware Resolution enum, as ga.timetree.single expects them
+RESOLUTIONS = {1: ('YEAR', "01/01/%s"), 2: ('MONTH', "01/%s/%s"), 3: ('DAY', "%s/%s/%s")}
+
+
+def parseDate(input):
+    # 'Time:2017', 'Time:05/2017' or 'Time:21/05/2017' -> (resolution, UTC timestamp in ms), ValueError otherwise
+    split = input.split(':', 1)[1].split('/') if isinstance(input, str) and ':' in input else []
+    if len(split) not in RESOLUTIONS:
+        raise ValueError("Invalid date %r" % (input,))
+    resolution, format = RESOLUTIONS[len(split)]
+    return resolution, calendar.timegm(time.strptime(format % tuple(split), "%d/%m/%Y")) * 1000
+
+
+def setDates(entries):
+    """
+    Link every target to its time tree node in one statement, entries are dicts with target, type and aid
+    ('Time:...'). Only the time nodes touched by this statement and missing the Time label get labeled
+    and decorated with their display property. Returns the indexes of the entries attached.
+    """
+    if not entries:
+        return set()
+    dates = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not all(k in entry for k in ('target', 'type', 'aid')):
+            raise ValueError("Entry %s needs a target, a type and an aid" % i)
+        resolution, timestamp = parseDate(entry['aid'])
+        dates.append({'index': i, 'target': entry['target'], 'type': entry['type'],
+                      'resolution': resolution, 'time': timestamp})
+    query = cypher.Query("UNWIND $dates AS date MATCH (n) WHERE ID(n) = date.target", dates=dates)
+    query.add(" MERGE (n)-[:HAS]->(l:Link:Attr {type: date.type}) WITH date, l")
+    query.add(" CALL ga.timetree.single({time: date.time, resolution: date.resolution, create: true}) YIELD node")
+    query.add(" MERGE (l)-[:IS]->(node)")
+    query.add(" WITH collect(DISTINCT date.index) AS attached, collect(DISTINCT node) AS touched")
+    query.add(" UNWIND touched AS t")
+    query.add(" OPTIONAL MATCH (t)<-[:CHILD*0..2]-(x) WHERE (x:Day OR x:Month OR x:Year) AND NOT x:Time")
+    query.add(" OPTIONAL MATCH path = (x)<-[:CHILD*0..2]-(:Year)")
+    query.add(" WITH attached, collect(DISTINCT {node: x, display: CASE WHEN x:Year THEN x.value")
+    query.add(" ELSE reduce(s = x.value + '', p IN tail(nodes(path)) | s + '/' + p.value) END}) AS decorated")
+    query.add(" WITH attached, [d IN decorated WHERE d.node IS NOT NULL] AS decorated")
+    query.add(" FOREACH (d IN decorated | FOREACH (x IN [d.node] | SET x:Node:Attribute:Time")
+    query.add(" CREATE (x)-[:HAS]->(:Link:Prop)-[:IS]->(:Property:display {value: d.display})))")
+    query.add(" RETURN attached")
+    attached = set()
+    for record in query.run():
+        attached.update(record['attached'])
+    return attached
+
+
 def setDate(input, target, type):
-    t = input.split(':')[1]
-    split = t.split('/')
-    if len(split) == 1:  # Year
-        timestamp = time.mktime(time.strptime("01/01/" + t, "%d/%m/%Y"))
-        query = ' CALL ga.timetree.single({time: %s, create: true})' % (str(timestamp)[:-2] + "000")
-        query = "MATCH (n) WHERE ID(n) = %s MERGE (n)-[:HAS]->(l:Link:Attr {type: '%s'}) WITH l" % (target, type)
-        query += " MATCH (y:Year) WHERE y.value = %s" % t.split('/')[0]
-        query += " CREATE (l)-[:IS]->(y)"
-        neo4j.query_neo4j(query)
-
-    elif len(split) == 2:  # Month
-        timestamp = time.mktime(time.strptime("01/" + split[0] + "/" + split[1], "%d/%m/%Y"))
-        query = "CALL ga.timetree.single({time: %s, create: true})" % (str(timestamp)[:-2] + "000")
-        neo4j.query_neo4j(query)
-        if split[0][:1] == '0':
-            split[0] = split[0][-1:]
-        query = "MATCH (n) WHERE ID(n) = %s MERGE (n)-[:HAS]->(l:Link:Attr {type: '%s'}) WITH l" % (target, type)
-        query += " MATCH (m:Month)<-[:CHILD]-(y:Year) WHERE m.value = %s AND y.value = %s" % (split[0], split[1])
-        query += " CREATE (l)-[:IS]->(m)"
-        neo4j.query_neo4j(query)
-
-    elif len(split) == 3:  # Day
-        query = "MATCH (n) WHERE ID(n) = %s MERGE (n)-[:HAS]->(l:Link:Attr {type: '%s'}) WITH l" % (target, type)
-        timestamp = time.mktime(time.strptime(split[0] + "/" + split[1] + "/" + split[2], "%d/%m/%Y"))
-        query += ' CALL ga.timetree.events.attach({node: l, time: %s, relationshipType: "IS"})' % (str(timestamp + 10)[:-2] + "000")
-        query += ' YIELD node RETURN node'
-        neo4j.query_neo4j(query)
-
-    neo4j.query_neo4j("MATCH (d:Day)<-[:CHILD]-(p1:Month)<-[:CHILD]-(p2:Year) WHERE NOT 'Time' in labels(d) SET d:Node:Attribute:Time CREATE (d)-[:HAS]->(lp:Link:Prop)-[:IS]->(p:Property:display {value: d.value + '/' + p1.value + '/' + p2.value})")
-    neo4j.query_neo4j("MATCH (m:Month)<-[:CHILD]-(p1:Year) WHERE NOT 'Time' in labels(m) SET m:Node:Attribute:Time  CREATE (m)-[:HAS]->(lp:Link:Prop)-[:IS]->(p:Property:display {value: m.value + '/' + p1.value})")
-    neo4j.query_neo4j("MATCH (y:Year) WHERE NOT 'Time' in labels(y) SET y:Node:Attribute:Time CREATE (y)-[:HAS]->(lp:Link:Prop)-[:IS]->(p:Property:display {value: y.value})")
+    return bool(setDates([{'aid': input, 'target': target, 'type': type}]))
+
+
+def getPropertyLinks(id, pids):
+    # ID of the Link:Prop between the node and each property, by pid
+    query = cypher.Query("UNWIND $pids AS pid MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id AND ID(p) = pid",
+                         id=id, pids=list(set(pids)))
+    query.add(" RETURN pid, ID(l) as lpid")
+    return dict((record['pid'], record['lpid']) for record in query.run())
+
+
+def setProperty(id, key, entry):
+    # Link the node to the Property:key {value}, replacing the property entry['pid'] when its value changed
+    if entry['pid'] >= 0:
+        query = cypher.Query("MATCH (p:Property:%s) WHERE ID(p) = $pid RETURN p.value as value", cypher.label(key),
+                             pid=entry['pid'])
+        if query.run().single()['value'] == entry['value']:
+            return None
+        query = cypher.Query("MATCH (n)--(l:Link:Prop)--(p:Property:%s) WHERE ID(n) = $id AND ID(p) = $pid", cypher.label(key),
+                             id=id, pid=entry['pid'])
+        query.add(" WITH l OPTIONAL MATCH (l)-[HAS]->(l2:Link) DETACH DELETE l, l2")
+        query.run()
+    query = cypher.Query("MERGE (p:Property:%s {value: $value}) WITH p MATCH (n) WHERE ID(n) = $id", cypher.label(key),
+                         value=entry['value'], id=id)
+    query.add(" WITH p, n MERGE (n)-[:HAS]->(:Link:Prop)-[:IS]->(p) RETURN ID(p) as pid")
+    return query.run().single()['pid']
+
+
+def addAttribute(id, entry):
+    if 'Time' in str(entry['aid']):
+        setDate(entry['aid'], id, entry['type'])
+    else:
+        query = cypher.Query("MATCH (n) MATCH (a:Node:Attribute) WHERE ID(n) = $id AND ID(a) = $aid",
+                             id=id, aid=entry['aid'])
+        query.add(" MERGE (n)-[:HAS]->(l:Link:Attr {type: $type})-[:IS]->(a)", type=entry['type'])
+        query.run()
+
+
+def addPropertyAttribute(id, pid, entry):
+    if 'Time' in str(entry['aid']):
+        query = cypher.Query("MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id AND ID(p) = $pid RETURN ID(l) as lpid",
+                             id=id, pid=pid)
+        lpid = query.run().single()['lpid']
+        setDate(entry['aid'], lpid, entry['type'])
+    else:
+        query = cypher.Query("MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id AND ID(p) = $pid",
+                             id=id, pid=pid)
+        query.add(" MATCH (a:Attribute) WHERE ID(a) = $aid MERGE (l)-[:HAS]->(:Link:Attr {type: $type})-[:IS]->(a)",
+                  aid=entry['aid'], type=entry['type'])
+        query.run()
+
+
+class NodeUpdate(object):
+    """
+    SetById payload compiled into UNWIND statements: one per kind of entry and one per property key,
+    instead of one to three queries per entry. Must run inside a write transaction.
+    """
+    RESERVED = ('reverse', 'source', 'target', 'delete', 'addAttrs', 'delAttrs', 'create')
+
+    def __init__(self, id, node):
+        super(NodeUpdate, self).__init__()
+        self.id = id
+        self.node = node
+        self.applied = {}
+        self.skipped = {}
+        self.newPid = {}
+
+    def run(self, key, entries, query, returns=''):
+        # entries are (index, params) in node[key], the query returns the index of every entry it applied
+        if not entries:
+            return []
+        query.add(" RETURN DISTINCT entry.index as index" + returns, id=self.id, entries=[dict(e, index=i) for i, e in entries])
+        records = list(query.run())
+        done = set(record['index'] for record in records)
+        self.report(key, [i for i, e in entries if i in done], [i for i, e in entries if i not in done])
+        return records
+
+    def report(self, key, applied, skipped):
+        if applied:
+            self.applied.setdefault(key, []).extend(self.node[key][i] for i in applied)
+        if skipped:
+            self.skipped.setdefault(key, []).extend(self.node[key][i] for i in skipped)
+
+    def reverse(self):
+        if self.node.get('reverse') and 'source' in self.node and 'target' in self.node:
+            query = cypher.Query('MATCH (s)-[rs:LINK]->(r)-[rt:LINK]->(t) WHERE ID(r) = $id AND ID(s) = $source AND ID(t) = $target',
+                                 id=self.id, source=self.node['source'], target=self.node['target'])
+            query.add(' CREATE (t)-[:LINK]->(r)-[:LINK]->(s) WITH rt, rs DELETE rt, rs RETURN count(*) as reversed')
+            self.applied['reverse'] = query.run().single()['reversed'] > 0
+
+    def delete(self):
+        entries = list(enumerate(self.node.get('delete', [])))
+        attrs = [(i, {'pid': e['pid'], 'aid': e['aid']}) for i, e in entries if e.get('pid') and e.get('aid')]
+        props = [(i, {'pid': e['pid']}) for i, e in entries if e.get('pid') and not e.get('aid')]
+        query = cypher.Query("UNWIND $entries AS entry MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id AND ID(p) = entry.pid")
+        query.add(" WITH l, entry MATCH (l)--(l2:Link:Attr)--(a) WHERE ID(a) = entry.aid DETACH DELETE l2")
+        self.run('delete', attrs, query)
+        query = cypher.Query("UNWIND $entries AS entry MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id AND ID(p) = entry.pid")
+        query.add(" OPTIONAL MATCH (l)-->(l2:Link) DETACH DELETE l, l2")
+        self.run('delete', props, query)
+
+    def addAttrs(self):
+        entries = list(enumerate(self.node.get('addAttrs', [])))
+        dates = [(i, e) for i, e in entries if 'Time' in str(e['aid'])]
+        attached = setDates([{'aid': e['aid'], 'target': self.id, 'type': e['type']} for i, e in dates])
+        self.report('addAttrs', [i for j, (i, e) in enumerate(dates) if j in attached],
+                    [i for j, (i, e) in enumerate(dates) if j not in attached])
+        query = cypher.Query("UNWIND $entries AS entry MATCH (n) WHERE ID(n) = $id MATCH (a:Node:Attribute) WHERE ID(a) = entry.aid")
+        query.add(" MERGE (n)-[:HAS]->(l:Link:Attr {type: entry.type})-[:IS]->(a)")
+        self.run('addAttrs', [(i, {'aid': e['aid'], 'type': e['type']}) for i, e in entries if 'Time' not in str(e['aid'])], query)
+
+    def delAttrs(self):
+        query = cypher.Query("UNWIND $entries AS entry MATCH (n)--(al:Link:Attr)--(a:Node:Attribute) WHERE ID(n) = $id AND ID(a) = entry.aid")
+        query.add(" DETACH DELETE al")
+        self.run('delAttrs', [(i, {'aid': aid}) for i, aid in enumerate(self.node.get('delAttrs', []))], query)
+
+    def properties(self, key):
+        # A known property (pid >= 0) is replaced when its value changed, a new one (pid < 0) is merged
+        entries = [(i, {'pid': e['pid'], 'value': e['value']}) for i, e in enumerate(self.node[key]) if 'pid' in e]
+        query = cypher.Query("UNWIND $entries AS entry MATCH (n) WHERE ID(n) = $id")
+        query.add(" OPTIONAL MATCH (old:Property:%s) WHERE ID(old) = entry.pid", cypher.label(key))
+        query.add(" WITH n, entry, old WHERE entry.pid < 0 OR old.value <> entry.value")
+        query.add(" OPTIONAL MATCH (n)--(l:Link:Prop)--(old) OPTIONAL MATCH (l)-->(l2:Link) DETACH DELETE l, l2")
+        query.add(" WITH DISTINCT n, entry MERGE (p:Property:%s {value: entry.value})", cypher.label(key))
+        query.add(" MERGE (n)-[:HAS]->(:Link:Prop)-[:IS]->(p)")
+        for record in self.run(key, entries, query, ", ID(p) as pid"):
+            pid = self.node[key][record['index']]['pid']
+            if pid < 0:
+                self.newPid[pid] = record['pid']
+
+    def create(self):
+        entries = []
+        dates = []
+        for i, entry in enumerate(self.node.get('create', [])):
+            if 'aid' not in entry:
+                continue
+            pid = entry['pid'] if entry['pid'] >= 0 else self.newPid.get(entry['pid'])
+            if pid is None:
+                self.report('create', [], [i])
+            elif 'Time' in str(entry['aid']):
+                dates.append((i, pid, entry))
+            else:
+                entries.append((i, {'pid': pid, 'aid': entry['aid'], 'type': entry['type']}))
+        if dates:
+            # Dates of a property hang off its Link:Prop
+            links = getPropertyLinks(self.id, [pid for i, pid, e in dates])
+            self.report('create', [], [i for i, pid, e in dates if pid not in links])
+            dates = [(i, {'aid': e['aid'], 'target': links[pid], 'type': e['type']}) for i, pid, e in dates if pid in links]
+            attached = setDates([e for i, e in dates])
+            self.report('create', [i for j, (i, e) in enumerate(dates) if j in attached],
+                        [i for j, (i, e) in enumerate(dates) if j not in attached])
+        query = cypher.Query("UNWIND $entries AS entry MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id AND ID(p) = entry.pid")
+        query.add(" MATCH (a:Attribute) WHERE ID(a) = entry.aid MERGE (l)-[:HAS]->(:Link:Attr {type: entry.type})-[:IS]->(a)")
+        self.run('create', entries, query)
+
+    def apply(self):
+        self.reverse()
+        self.delete()
+        self.addAttrs()
+        self.delAttrs()
+        for key in self.node:
+            if key not in self.RESERVED:
+                self.properties(key)
+        self.create()
+        return {'id': self.id, 'applied': self.applied, 'skipped': self.skipped,
+                'pids': dict((str(k), v) for k, v in self.newPid.items())}
 
 
 class SetById(Resource):
+    @invalidating
     def put(self, id):
         """
           @api {put} /set/:id Set by id 
           @apiName SetById
           @apiGroup Setters
-          @apiDescription Modify a node
+          @apiDescription Modify a node, the whole update runs in one transaction
           @apiParam {String} id id
-          @apiSuccess {String} id of the node
+          @apiSuccess {Object} result entries applied and skipped by key, pids of the new properties
        """
-        node = request.get_json()
-        if 'reverse' in node.keys() and 'source' in node.keys() and 'target' in node.keys():
-            if node['reverse']:
-                query = 'MATCH (s)-[rs:LINK]->(r)-[rt:LINK]->(t) WHERE ID(r) = %s AND ID(s) = %s AND ID(t) = %s' % (id, node['source'], node['target'])
-                query += ' CREATE (t)-[:LINK]->(r)-[:LINK]->(s) WITH rt, rs DELETE rt, rs'
-                neo4j.query_neo4j(query)
-        if 'reverse' in node.keys():
-            del node['reverse']
-        newPid = {}
-        for key in node:
-            for entry in node[key]:
-                if key == 'delete':
-                    if 'pid' in entry.keys() and 'aid' in entry.keys() and entry['pid'] and entry['aid']:
-                        query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s AND ID(p) = %s WITH l MATCH (l)--(l2:Link:Attr)--(a) WHERE ID(a) = %s  DETACH DELETE l2" % (id, entry['pid'], entry['aid'])
-                    elif 'pid' in entry.keys() and entry['pid']:
-                        query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s AND ID(p) = %s WITH l OPTIONAL MATCH (l)-[HAS]->(l2:Link) DETACH DELETE l, l2" % (id, entry['pid'])
-                    neo4j.query_neo4j(query)
-                elif key == 'addAttrs':
-                    if 'Time' in str(entry['aid']):
-                        setDate(entry['aid'], id, entry['type'])
-                    else:
-                        query = "MATCH (n) MATCH (a:Node:Attribute) WHERE ID(n) = %s AND ID(a) = %s MERGE (n)-[:HAS]->(l:Link:Attr {type: '%s'})-[:IS]->(a)" % (id, entry['aid'], entry['type'])
-                        neo4j.query_neo4j(query)
-                elif key == 'delAttrs':
-                    query = "MATCH (n)--(al:Link:Attr)--(a:Node:Attribute) WHERE ID(n) = %s AND ID(a) = %s DETACH DELETE al" % (id, entry)
-                    neo4j.query_neo4j(query)
-                elif key != 'create' and key != 'source' and key != 'target' and'pid' in entry.keys() and entry['pid'] >= 0:
-                    query = "MATCH (p:Property:%s) WHERE ID(p) = %s RETURN p.value as value" % (key, entry['pid'])
-                    if neo4j.query_neo4j(query).single()['value'] != entry['value']:
-                        query = "MATCH (n)--(l:Link:Prop)--(p:Property:%s) WHERE ID(n) = %s AND ID(p) = %s WITH l OPTIONAL MATCH (l)-[HAS]->(l2:Link) DETACH DELETE l, l2" % (key, id, entry['pid'])
-                        neo4j.query_neo4j(query)
-                        query = 'MERGE (p:Property:%s {value: "%s"}) WITH p MATCH (n) WHERE ID(n) = %s' % (key, entry['value'].replace('"',"'"), id)
-                        query += " WITH p, n MERGE (n)-[:HAS]->(:Link:Prop)-[:IS]->(p)"
-                    neo4j.query_neo4j(query)
-                elif key != 'create' and key != 'source' and key != 'target' and 'pid' in entry.keys() and entry['pid'] < 0:
-                    query = 'MERGE (p:Property:%s {value: "%s"}) WITH p MATCH (n) WHERE ID(n) = %s' % (key, entry['value'].replace('"',"'"), id)
-                    query += " WITH p, n MERGE (n)-[:HAS]->(:Link:Prop)-[:IS]->(p) RETURN ID(p) as pid"
-                    newPid[entry['pid']] = neo4j.query_neo4j(query).single()['pid']
-        for key in node:
-            for entry in node[key]:
-                if key == 'create':
-                    if entry['pid'] >= 0:
-                        pid = entry['pid']
-                    else:
-                        pid = newPid[entry['pid']]
-                    if 'aid' in entry.keys():
-                        if 'Time' in str(entry['aid']):
-                            query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s AND ID(p) = %s RETURN ID(l) as lpid" % (id, pid)
-                            lpid = neo4j.query_neo4j(query).single()['lpid']
-                            setDate(entry['aid'], lpid, entry['type'])
-                        else:
-                            query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s AND ID(p) = %s MATCH (a:Attribute) WHERE ID(a) = %s  MERGE (l)-[:HAS]->(:Link:Attr {type: '%s'})-[:IS]->(a)" % (id, pid, entry['aid'], entry['type'])
-                            neo4j.query_neo4j(query)
-        return makeResponse('maybe ok', 200) # todo: manage error code and exception
+        try:
+            with neo4j.write_transaction():
+                result = NodeUpdate(id, request.get_json()).apply()
+        except (CypherError, ValueError) as e:
+            return makeResponse("Nothing applied: %s" % e, 400)
+        # Merged properties, links and dates: the label deltas are not known
+        if any(result['applied'].values()):
+            stats.invalidate()
+        return makeResponse(result, 200)
+
+
+class SetDates(Resource):
+    @invalidating
+    def put(self):
+        """
+          @api {put} /setDates/ Set dates
+          @apiName SetDates
+          @apiGroup Setters
+          @apiDescription Link many elements to a date at once, in one transaction
+          @apiParam {Array} entries [{"target": id, "type": link type, "aid": "Time:dd/mm/yyyy"}], the date can also be mm/yyyy or yyyy
+          @apiSuccess {Object} result entries applied and skipped
+       """
+        entries = request.get_json()
+        if not isinstance(entries, list):
+            return makeResponse("A json array of entries is expected", 400)
+        try:
+            with neo4j.write_transaction():
+                attached = setDates(entries)
+        except CypherError as e:
+            return makeResponse("Nothing applied: %s" % e, 400)
+        except ValueError as e:
+            return makeResponse("Invalid date entries: %s" % e, 400)
+        if attached:
+            stats.invalidate()
+        return makeResponse({'applied': [e for i, e in enumerate(entries) if i in attached],
+                             'skipped': [e for i, e in enumerate(entries) if i not in attached]}, 200)
 
 
 class CreateNode(Resource):
+    @invalidating
     def post(self):
         """
           @api {post} /createNode/ Create new node
@@ -125,32 +296,18 @@ class CreateNode(Resource):
         del node['labels']
         if 'reverse' in node.keys():
             del node['reverse']
-        query = "CREATE (n:"
-        for l in labels:
-            query += "%s:" % l
-        query = "%s) RETURN ID(n) as id" % query[:-1]
-        id = neo4j.query_neo4j(query).single()['id']
+        query = cypher.Query("CREATE (n:%s) RETURN ID(n) as id", cypher.label(':'.join(labels)))
+        id = query.run().single()['id']
+        stats.add(labels)
         newPid = {}
         for key in node:
             for entry in node[key]: # todo check if the user want to delete somethings not already create
                 if key == 'addAttrs':
-                    if 'Time' in str(entry['aid']):
-                        setDate(entry['aid'], id, entry['type'])
-                    else:
-                        query = "MATCH (n) MATCH (p:Node:Attribute) WHERE ID(n) = %s AND ID(p) = %s MERGE (n)-[:HAS]->(l:Link:Attr {type: '%s'})-[:IS]->(p)" % (id, entry['aid'], entry['type'])
-                        neo4j.query_neo4j(query)
+                    addAttribute(id, entry)
                 elif key != 'create' and 'pid' in entry.keys() and entry['pid'] >= 0:
-                    query = "MATCH (p:Property:%s) WHERE ID(p) = %s RETURN p.value as value" % (key, entry['pid'])
-                    if neo4j.query_neo4j(query).single()['value'] != entry['value']:
-                        query = "MATCH (n)--(l:Link:Prop)--(p:Property:%s) WHERE ID(n) = %s AND ID(p) = %s WITH l OPTIONAL MATCH (l)-[HAS]->(l2:Link) DETACH DELETE l, l2" % (key, id, entry['pid'])
-                        neo4j.query_neo4j(query)
-                        query = 'MERGE (p:Property:%s {value: "%s"}) WITH p MATCH (n) WHERE ID(n) = %s' % (key, entry['value'].replace('"',"'"), id)
-                        query += " WITH p, n MERGE (n)-[:HAS]->(:Link:Prop)-[:IS]->(p)"
-                    neo4j.query_neo4j(query)
+                    setProperty(id, key, entry)
                 elif key != 'create' and 'pid' in entry.keys() and 'value' in entry.keys() and entry['pid'] < 0 and entry['value']:
-                    query = 'MERGE (p:Property:%s {value: "%s"}) WITH p MATCH (n) WHERE ID(n) = %s' % (key, entry['value'].replace('"',"'"), id)
-                    query += " WITH p, n MERGE (n)-[:HAS]->(:Link:Prop)-[:IS]->(p) RETURN ID(p) as pid"
-                    newPid[entry['pid']] = neo4j.query_neo4j(query).single()['pid']
+                    newPid[entry['pid']] = setProperty(id, key, entry)
         for key in node:
             for entry in node[key]:
                 if key == 'create':
@@ -159,17 +316,14 @@ class CreateNode(Resource):
                     else:
                         pid = newPid[entry['pid']]
                     if 'aid' in entry.keys():
-                        if 'Time' in str(entry['aid']):
-                            query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s AND ID(p) = %s RETURN ID(l) as lpid" % (id, pid)
-                            lpid = neo4j.query_neo4j(query).single()['lpid']
-                            setDate(entry['aid'], lpid, entry['type'])
-                        else:
-                            query = "MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = %s AND ID(p) = %s MATCH (a:Attribute) WHERE ID(a) = %s  MERGE (l)-[:HAS]->(:Link:Attr {type: '%s'})-[:IS]->(a)" % (id, pid, entry['aid'], entry['type'])
-                            neo4j.query_neo4j(query)
+                        addPropertyAttribute(id, pid, entry)
+        if any(node.values()):
+            stats.invalidate()
         return makeResponse(id, 200)
 
 
 class CreateEdge(Resource):
+    @invalidating
     def post(self):
         """
           @api {post} /createEdge/ Create new edge
@@ -179,25 +333,68 @@ class CreateEdge(Resource):
           @apiSuccess ok
        """
         edge = request.get_json()
-        query = "MATCH (edge) WHERE ID(edge) = %s RETURN labels(edge) as labels" % edge['id']
-        result = neo4j.query_neo4j(query).single()
-        query = "MATCH (source) WHERE ID(source) = %s" % edge['source']
-        query += " WITH source MATCH (target) WHERE ID(target) = %s" % edge['target']
-        query += " WITH source, target MATCH (edge) WHERE ID(edge) = %s" % edge['id']
+        query = cypher.Query("MATCH (edge) WHERE ID(edge) = $id RETURN labels(edge) as labels", id=edge['id'])
+        result = query.run().single()
+        query = cypher.Query("MATCH (source) WHERE ID(source) = $source", source=edge['source'])
+        query.add(" WITH source MATCH (target) WHERE ID(target) = $target", target=edge['target'])
+        query.add(" WITH source, target MATCH (edge) WHERE ID(edge) = $id", id=edge['id'])
         if 'Attr' in result['labels']:
-            query += " WITH source, target, edge CREATE r=(source)-[:HAS]->(edge)-[:IS]->(target) RETURN r"
+            query.add(" WITH source, target, edge CREATE r=(source)-[:HAS]->(edge)-[:IS]->(target) RETURN r")
         elif 'Prop' in result['labels']:
-            query += " WITH source, target, edge CREATE r=(source)-[:HAS]->(edge)-[:IS]->(target) RETURN r"
+            query.add(" WITH source, target, edge CREATE r=(source)-[:HAS]->(edge)-[:IS]->(target) RETURN r")
         else:
-            query += " WITH source, target, edge CREATE r=(source)-[:LINK]->(edge)-[:LINK]->(target) RETURN r"
-        result = neo4j.query_neo4j(query)
+            query.add(" WITH source, target, edge CREATE r=(source)-[:LINK]->(edge)-[:LINK]->(target) RETURN r")
+        result = query.run()
         try:
             return makeResponse("ok", 200)
         except ResultError:
             return makeResponse("Unable to create a new edge", 400)
 
 
+def deleteElements(ids):
+    """
+    Delete the elements, their property links with the attribute links hanging off them, the properties left
+    orphan and their attribute links. Must run inside a write transaction, returns the counts removed and
+    the labels of every deleted node.
+    """
+    counts = {}
+    removed = []
+    query = cypher.Query("UNWIND $ids AS id MATCH (n)--(pl:Prop)-->(la:Link:Attr) WHERE ID(n) = id", ids=ids)
+    query.add(" WITH collect(DISTINCT la) AS links WITH links, [l IN links | labels(l)] AS labels")
+    query.add(" FOREACH (l IN links | DETACH DELETE l) RETURN size(links) AS count, labels")
+    record = query.run().single()
+    counts['propertyAttributeLinks'] = record['count']
+    removed.extend(record['labels'])
+    query = cypher.Query("UNWIND $ids AS id MATCH (n)--(pl:Prop)--(p:Property) WHERE ID(n) = id", ids=ids)
+    query.add(" WITH collect(DISTINCT pl) AS links, collect(DISTINCT ID(p)) AS pids")
+    query.add(" WITH links, pids, [l IN links | labels(l)] AS labels")
+    query.add(" FOREACH (l IN links | DETACH DELETE l) RETURN size(links) AS count, pids, labels")
+    record = query.run().single()
+    counts['propertyLinks'] = record['count']
+    removed.extend(record['labels'])
+    query = cypher.Query("UNWIND $pids AS pid MATCH (p:Property) WHERE ID(p) = pid AND NOT (p)--()", pids=record['pids'])
+    query.add(" WITH collect(p) AS properties WITH properties, [p IN properties | labels(p)] AS labels")
+    query.add(" FOREACH (p IN properties | DETACH DELETE p) RETURN size(properties) AS count, labels")
+    record = query.run().single()
+    counts['properties'] = record['count']
+    removed.extend(record['labels'])
+    query = cypher.Query("UNWIND $ids AS id MATCH (n)--(al:Attr) WHERE ID(n) = id", ids=ids)
+    query.add(" WITH collect(DISTINCT al) AS links WITH links, [l IN links | labels(l)] AS labels")
+    query.add(" FOREACH (l IN links | DETACH DELETE l) RETURN size(links) AS count, labels")
+    record = query.run().single()
+    counts['attributeLinks'] = record['count']
+    removed.extend(record['labels'])
+    query = cypher.Query("UNWIND $ids AS id MATCH (n) WHERE ID(n) = id", ids=ids)
+    query.add(" WITH collect(DISTINCT n) AS nodes WITH nodes, [n IN nodes | labels(n)] AS labels")
+    query.add(" FOREACH (n IN nodes | DETACH DELETE n) RETURN size(nodes) AS count, labels")
+    record = query.run().single()
+    counts['nodes'] = record['count']
+    removed.extend(record['labels'])
+    return counts, removed
+
+
 class DeleteById(Resource):
+    @invalidating
     def delete(self, id):
         """
           @api {delete} /:id
@@ -205,13 +402,32 @@ class DeleteById(Resource):
           @apiGroup Setters
           @apiDescription delete a node
        """
-        query = "MATCH (n)--(pl:Prop)--(p:Property) WHERE ID(n) = %s DETACH DELETE pl RETURN ID(p) as prop" % id
-        result = neo4j.query_neo4j(query)
-        for record in result:
-            query = "MATCH (p:Property) WHERE id(p) = %s AND NOT (p)--() DETACH DELETE p" % record['prop']
-            neo4j.query_neo4j(query)
-        query = "MATCH (n)--(al:Attr) WHERE ID(n) = %s DETACH DELETE al" % id
-        neo4j.query_neo4j(query)
-        query = "MATCH (n) WHERE ID(n) = %s DETACH DELETE n" % id
-        neo4j.query_neo4j(query)
-        return makeResponse('Deleted', 200) # todo: error managing
\ No newline at end of file
+        with neo4j.write_transaction():
+            counts, removed = deleteElements([id])
+        for labels in removed:
+            stats.remove(labels)
+        return makeResponse('Deleted', 200) # todo: error managing
+
+
+class DeleteByIds(Resource):
+    @invalidating
+    def post(self):
+        """
+          @api {post} /deleteByIds/ Delete many elements
+          @apiName DeleteByIds
+          @apiGroup Setters
+          @apiDescription Delete the elements of the json array of ids with their properties links, orphan
+          properties and attributes links, in one transaction
+          @apiSuccess {Object} result counts removed by kind
+       """
+        ids = request.get_json()
+        if not isinstance(ids, list) or not all(isinstance(id, int) for id in ids):
+            return makeResponse("A json array of ids is expected", 400)
+        try:
+            with neo4j.write_transaction():
+                counts, removed = deleteElements(list(set(ids)))
+        except CypherError as e:
+            return makeResponse("Nothing deleted: %s" % e, 400)
+        for labels in removed:
+            stats.remove(labels)
+        return makeResponse(counts, 200)
@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+import configparser
+import threading
+import time
+import uuid
+
+config = configparser.ConfigParser()
+config.read("config.ini")
+
+
+class Job(object):
+    def __init__(self, kind):
+        super(Job, self).__init__()
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.state = 'queued'
+        self.stage = None
+        self.stages = []
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.error = None
+        self.stats = {}
+
+    def setStage(self, stage):
+        if stage != self.stage:
+            self.stage = stage
+            self.stages.append({'stage': stage, 'at': round(time.time() - self.started, 3)})
+
+    def getStatus(self):
+        now = self.finished or time.time()
+        return {'id': self.id,
+                'kind': self.kind,
+                'state': self.state,
+                'stage': self.stage,
+                'stages': self.stages,
+                'elapsed': round(now - (self.started or self.created), 3),
+                'error': self.error,
+                'stats': self.stats}
+
+
+class JobManager(object):
+    """
+    Run heavy graph builds in a bounded thread pool, results are kept `ttl` seconds after completion.
+    """
+    def __init__(self, workers, max_jobs, ttl):
+        super(JobManager, self).__init__()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def purge(self):
+        now = time.time()
+        with self.lock:
+            for id in [id for id, job in self.jobs.items() if job.finished and now - job.finished > self.ttl]:
+                del self.jobs[id]
+
+    def submit(self, kind, target, *args):
+        self.purge()
+        with self.lock:
+            if len(self.jobs) >= self.max_jobs:
+                return None
+            job = Job(kind)
+            self.jobs[job.id] = job
+        self.executor.submit(self.execute, job, target, args)
+        return job
+
+    def execute(self, job, target, args):
+        job.started = time.time()
+        job.state = 'running'
+        try:
+            job.result = target(job, *args)
+            job.state = 'done'
+        except Exception as e:
+            job.error = str(e) or e.__class__.__name__
+            job.state = 'failed'
+        job.finished = time.time()
+
+    def get(self, id):
+        self.purge()
+        with self.lock:
+            return self.jobs.get(id)
+
+
+jobs = JobManager(config.getint('jobs', 'workers', fallback=2),
+                  config.getint('jobs', 'max_jobs', fallback=100),
+                  config.getint('jobs', 'ttl', fallback=600))
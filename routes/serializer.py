@@ -0,0 +1,134 @@
+def escape(value):
+    return value.replace('"', '\\\"')
+
+
+def escapeOther(value, newline, carriage, tab):
+    return value.replace('"', '\\\"').replace("\n", newline).replace("\r", carriage).replace("\t", tab)
+
+
+class GraphSerializer(object):
+    """
+    Serialize a tulip graph to the sigma json format of getJson.
+    Properties are resolved once per graph and read through their typed accessors,
+    properties left to their default value on every element are skipped.
+    """
+    def __init__(self, graph, params={'edge_type': 'arrow'}):
+        super(GraphSerializer, self).__init__()
+        self.graph = graph
+        self.edge_type = params['edge_type']
+
+    def edgeFields(self):
+        graph = self.graph
+        fields = []
+        for prop in graph.getObjectProperties():
+            name = prop.getName()
+            if name == "viewColor":
+                color = graph.getColorProperty(name)
+
+                def field(e, edge, color=color):
+                    c = color[edge]
+                    e["color"] = 'rgb(%s,%s,%s)' % (c.getR(), c.getG(), c.getB())
+            elif name == "name":
+                def field(e, edge, prop=prop):
+                    label = prop.getEdgeStringValue(edge)
+                    if label:
+                        e["label"] = escape(label)
+            elif name == "neo4j_id":
+                def field(e, edge, prop=prop):
+                    e["id"] = prop.getEdgeValue(edge)
+            elif name == "timestamp":
+                def field(e, edge, prop=prop):
+                    value = prop.getEdgeValue(edge)
+                    if value:
+                        e["timestamp"] = value
+            elif prop.numberOfNonDefaultValuatedEdges():
+                def field(e, edge, prop=prop, name=name, default=prop.getEdgeDefaultStringValue()):
+                    value = prop.getEdgeStringValue(edge)
+                    if value != default and value:
+                        e[name] = escapeOther(value, "\\n", "\\r", "\\t")
+            else:
+                continue
+            fields.append(field)
+        return fields
+
+    def nodeFields(self):
+        graph = self.graph
+        fields = []
+        for prop in graph.getObjectProperties():
+            name = prop.getName()
+            if name == "viewColor":
+                color = graph.getColorProperty(name)
+
+                def field(n, node, color=color):
+                    c = color[node]
+                    n["color"] = 'rgb(%s,%s,%s)' % (c.getR(), c.getG(), c.getB())
+            elif name == "name":
+                def field(n, node, prop=prop):
+                    label = prop.getNodeStringValue(node)
+                    if label:
+                        n["label"] = escape(label)
+                    else:
+                        n["label"] = "node" + str(node.id)
+            elif name == "viewSize":
+                size = graph.getSizeProperty(name)
+
+                def field(n, node, size=size):
+                    s = size[node]
+                    n["size"] = (int(s.getW()) + int(s.getH())) / 2
+            elif name == "viewLayout":
+                layout = graph.getLayoutProperty(name)
+
+                def field(n, node, layout=layout):
+                    # Coordinates are float32: parse their printed form, widening them gives 0.10000000149011612 for 0.1
+                    coord = layout.getNodeStringValue(node)[1:-1].split(',')
+                    n["x"] = float(coord[0])
+                    n["y"] = float(coord[1])
+            elif name == "neo4j_id":
+                def field(n, node, prop=prop):
+                    n["id"] = prop.getNodeValue(node)
+            elif name == "viewSelection":
+                def field(n, node, prop=prop):
+                    n["viewSelection"] = prop.getNodeValue(node)
+            elif prop.numberOfNonDefaultValuatedNodes():
+                def field(n, node, prop=prop, name=name, default=prop.getNodeDefaultStringValue()):
+                    value = prop.getNodeStringValue(node)
+                    if value != default and value:
+                        n[name] = escapeOther(value, "", "", "")
+            else:
+                continue
+            fields.append(field)
+        return fields
+
+    def edges(self):
+        fields = self.edgeFields()
+        property_id = self.graph.getStringProperty("neo4j_id")
+        seen = set()
+        for edge in self.graph.getEdges():
+            e = {"source": property_id.getNodeValue(self.graph.source(edge)),
+                 "target": property_id.getNodeValue(self.graph.target(edge))}
+            for field in fields:
+                field(e, edge)
+            e["type"] = self.edge_type
+            if e.get("id"):
+                if e["id"] in seen:
+                    continue
+                seen.add(e["id"])
+            yield e
+
+    def nodes(self):
+        self.graph.getLayoutProperty("viewLayout").center()
+        fields = self.nodeFields()
+        seen = set()
+        for node in self.graph.getNodes():
+            n = {}
+            for field in fields:
+                field(n, node)
+            if n.get("id"):
+                if n["id"] in seen:
+                    continue
+                seen.add(n["id"])
+            yield n
+
+    def toDict(self):
+        edges = list(self.edges())
+        return {"edges": edges, "nodes": list(self.nodes())}
@@ -0,0 +1,90 @@
+from flask_restful import Resource
+from routes.utils import makeResponse
+from graphtulip.models import registry
+from routes.cache import responses
+from graphtulip.layout import layouts
+from connector.labels import stats
+
+
+class ModelsCache(Resource):
+    def get(self):
+        """
+           @api {get} /cache/models Get the model registry state
+           @apiName ModelsCache
+           @apiGroup Settings
+           @apiDescription Return the state of the cached label -> color/labeling index built from the mongo models
+           @apiSuccess {Object} result loaded models, indexed labels, age and ttl of the index
+        """
+        return makeResponse(registry.getStats(), 200)
+
+    def delete(self):
+        """
+           @api {delete} /cache/models Invalidate the model registry
+           @apiName ModelsCacheInvalidate
+           @apiGroup Settings
+           @apiDescription Force a reload of the models on the next graph request (to call after a model update)
+           @apiSuccess {String} ok
+        """
+        registry.invalidate()
+        responses.invalidate()
+        return makeResponse('ok', 200)
+
+
+class ResponsesCache(Resource):
+    def get(self):
+        """
+           @api {get} /cache/responses Get the graph response cache statistics
+           @apiName ResponsesCache
+           @apiGroup Settings
+           @apiDescription Return size, budget, hits, misses and evictions of the graph response cache
+           @apiSuccess {Object} result cache statistics
+        """
+        return makeResponse(responses.getStats(), 200)
+
+    def delete(self):
+        """
+           @api {delete} /cache/responses Clear the graph response cache
+           @apiName ResponsesCacheClear
+           @apiGroup Settings
+           @apiDescription Drop every cached graph response
+           @apiSuccess {String} ok
+        """
+        responses.invalidate()
+        return makeResponse('ok', 200)
+
+
+class LayoutsCache(Resource):
+    def get(self):
+        """
+           @api {get} /cache/layouts Get the layout cache statistics
+           @apiName LayoutsCache
+           @apiGroup Settings
+           @apiDescription Return estimated size in bytes, hits, misses and evictions of the layout position cache,
+           the layouts too large to keep in memory (skipped) and too large to persist (oversized)
+           @apiSuccess {Object} result cache statistics
+        """
+        return makeResponse(layouts.getStats(), 200)
+
+
+class LabelsCache(Resource):
+    def get(self):
+        """
+           @api {get} /cache/labels Get the label statistics snapshot state
+           @apiName LabelsCache
+           @apiGroup Settings
+           @apiDescription Return the number of label combinations, age and refresh counters of the snapshot
+           behind /getLabelsHierarchy
+           @apiSuccess {Object} result snapshot statistics
+        """
+        return makeResponse(stats.getStats(), 200)
+
+    def delete(self):
+        """
+           @api {delete} /cache/labels Refresh the label statistics
+           @apiName LabelsCacheRefresh
+           @apiGroup Settings
+           @apiDescription Mark the snapshot stale, it is recomputed in background
+           @apiSuccess {String} ok
+        """
+        stats.invalidate()
+        return makeResponse('ok', 200)
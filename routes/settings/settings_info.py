@@ -2,11 +2,12 @@ import psutil
 from flask_restful import Resource
 from routes.utils import makeResponse
 from neo4j.v1 import ResultError
-from connector import neo4j
+from connector import neo4j, cypher
 
 
 class Info(Resource):
     def get(self):
         # todo change status if not ok
-        response = {"status": "ok", "version": "0000000000000", "percentRamUsage": psutil.virtual_memory()[2], "percentDiskUsage": psutil.disk_usage('/')[3]}
+        response = {"status": "ok", "version": "0000000000000", "percentRamUsage": psutil.virtual_memory()[2], "percentDiskUsage": psutil.disk_usage('/')[3],
+                    "neo4jPool": neo4j.pool.getStats(), "cypherTexts": cypher.texts.getStats()}
         return makeResponse(response, 200)
\ No newline at end of file
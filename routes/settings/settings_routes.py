@@ -1,7 +1,14 @@
 from routes.settings.settings_info import Info
+from routes.settings.settings_cache import ModelsCache, ResponsesCache, LayoutsCache, LabelsCache
 
 
 def add_settings_routes(api):
 
     # Settings
     api.add_resource(Info, '/info')
+
+    # Cache
+    api.add_resource(ModelsCache, '/cache/models')
+    api.add_resource(ResponsesCache, '/cache/responses')
+    api.add_resource(LayoutsCache, '/cache/layouts')
+    api.add_resource(LabelsCache, '/cache/labels')
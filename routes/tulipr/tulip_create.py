@@ -5,7 +5,10 @@ import time
 from tulip import tlp
 from flask_restful import Resource, reqparse, abort
 from neo4j.v1.exceptions import CypherError
-from routes.utils import makeResponse, getJson, getHtml, getCsv, makeHtmlResponse, makeCsvResponse, applyLayout
+from routes.utils import makeResponse, getJson, getHtml, getCsv, makeHtmlResponse, makeCsvResponse, applyLayout, \
+    addStatsHeader, makeStreamResponse, streamJson, makeBinaryResponse
+from routes.binary import getBinary
+from routes.cache import cached
 from graphtulip.createtlp import CreateTlp
 
 
@@ -17,6 +20,7 @@ parser.add_argument('layout')
 parser.add_argument('format')
 parser.add_argument('target')
 parser.add_argument('depth')
+parser.add_argument('budget')
 parser.add_argument('label_key_left')
 parser.add_argument('label_key_right')
 parser.add_argument('label_key_edge')
@@ -24,6 +28,8 @@ parser.add_argument('color_left')
 parser.add_argument('color_right')
 parser.add_argument('color_edge')
 parser.add_argument('query')
+parser.add_argument('stream')
+parser.add_argument('compress')
 
 
 class GetRandomGraph(Resource):
@@ -53,8 +59,13 @@ class GetQueryGraph(Resource):
        @apiDescription Get graph with a query
        @apiParam {value} query
        @apiParam {layout} tulip layout algorithm to apply
+       @apiParam {stream} stream != 0 to stream the json by chunks
+       @apiParam {format} format html for html quick preview, csv for a csv export, binary for the columnar format
+       @apiParam {target} target nodes or edges, rows of the csv export
+       @apiParam {compress} compress gzip to download the csv export gzipped
        @apiSuccess {Graph} Graph in json format.
     """
+    @cached
     def get(self):
         creator = CreateTlp()
         params = parser.parse_args()
@@ -67,11 +78,16 @@ class GetQueryGraph(Resource):
             args['layout'] = 'Circular (OGDF)'
         applyLayout(graph, args['layout'])
         if args['format'] == 'html':
-            return makeHtmlResponse(getHtml(graph), 200)
+            return addStatsHeader(makeHtmlResponse(getHtml(graph), 200), creator.stats)
         elif args['format'] == 'csv':
-            return makeCsvResponse(getCsv(graph, args['target']), 200)
+            compress = args['compress'] == 'gzip'
+            return addStatsHeader(makeCsvResponse(getCsv(graph, args['target'], compress), 200, compress), creator.stats)
+        elif args['format'] == 'binary':
+            return addStatsHeader(makeBinaryResponse(getBinary(graph), 200), creator.stats)
+        elif args['stream'] and args['stream'] != '0':
+            return addStatsHeader(makeStreamResponse(streamJson(graph), 200), creator.stats)
         else:
-            return makeResponse(getJson(graph), 200)
+            return addStatsHeader(makeResponse(getJson(graph), 200), creator.stats)
 
 
 class GetGraphLabelEdgeLabel(Resource):
@@ -84,11 +100,13 @@ class GetGraphLabelEdgeLabel(Resource):
        @apiParam {String} edge edge between
        @apiParam {String} label second label
        @apiParam {String} layout tulip layout algorithm to apply
-       @apiParam {String} format html for html quick preview
+       @apiParam {String} format html for html quick preview, binary for the columnar format (see routes/binary.py)
        @apiParam {String} label_key_left key of the property to field label field of the left node
        @apiParam {String} label_key_right key of the property to field label field of the right node
+       @apiParam {String} stream != 0 to stream the json by chunks
        @apiSuccess {Graph} Graph in json format.
     """
+    @cached
     def get(self, label1, edge, label2):
         creator = CreateTlp()
         params = (label1, edge, label2, parser.parse_args())
@@ -96,9 +114,13 @@ class GetGraphLabelEdgeLabel(Resource):
         args = parser.parse_args()
         applyLayout(graph, args['layout'])
         if args['format'] == 'html':
-            return makeHtmlResponse(getHtml(graph), 200)
+            return addStatsHeader(makeHtmlResponse(getHtml(graph), 200), creator.stats)
+        elif args['format'] == 'binary':
+            return addStatsHeader(makeBinaryResponse(getBinary(graph), 200), creator.stats)
+        elif args['stream'] and args['stream'] != '0':
+            return addStatsHeader(makeStreamResponse(streamJson(graph), 200), creator.stats)
         else:
-            return makeResponse(getJson(graph), 200)
+            return addStatsHeader(makeResponse(getJson(graph), 200), creator.stats)
 
 
 class GetGraphNeighboursById(Resource):
@@ -108,8 +130,11 @@ class GetGraphNeighboursById(Resource):
         @apiGroup Graphs
         @apiDescription Get neighbours graph with id / edge type
         @apiParam {String} edge edge between
-        @apiParam {String} format html for html quick preview
+        @apiParam {String} format html for html quick preview, binary for the columnar format (see routes/binary.py)
         @apiParam {String} layout tulip layout algorithm to apply
+        @apiParam {Integer} depth number of hops to expand (default 1)
+        @apiParam {Integer} budget maximum number of new nodes admitted per hop
+        @apiParam {String} stream != 0 to stream the json by chunks
         @apiSuccess {Graph} Graph in json format.
        @api {get} /getGraphNeighboursById/:id/:edge get neighbours graph with id and edge type 
        @apiName getGraphNeighboursById
@@ -119,6 +144,7 @@ class GetGraphNeighboursById(Resource):
        @apiParam {String} layout tulip layout algorithm to apply
        @apiSuccess {Graph} Graph in json format.
     """
+    @cached
     def get(self, id, edge, label):
         creator = CreateTlp()
         params = (id, edge, label, parser.parse_args())
@@ -128,6 +154,10 @@ class GetGraphNeighboursById(Resource):
             args['layout'] = config['api']['default_layout']
         applyLayout(graph, args['layout'])
         if args['format'] == 'html':
-            return makeHtmlResponse(getHtml(graph), 200)
+            return addStatsHeader(makeHtmlResponse(getHtml(graph), 200), creator.stats)
+        elif args['format'] == 'binary':
+            return addStatsHeader(makeBinaryResponse(getBinary(graph), 200), creator.stats)
+        elif args['stream'] and args['stream'] != '0':
+            return addStatsHeader(makeStreamResponse(streamJson(graph), 200), creator.stats)
         else:
-            return makeResponse(getJson(graph), 200)
+            return addStatsHeader(makeResponse(getJson(graph), 200), creator.stats)
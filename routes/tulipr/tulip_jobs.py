@@ -0,0 +1,115 @@
+import configparser
+import json
+from flask_restful import Resource
+from neo4j.v1.exceptions import CypherError
+from routes.utils import makeResponse, getJson, applyLayout
+from routes.jobs import jobs
+from routes.tulipr.tulip_create import parser
+from graphtulip.createtlp import CreateTlp
+
+config = configparser.ConfigParser()
+config.read("config.ini")
+
+
+def buildGraph(job, builder, params, args):
+    creator = CreateTlp()
+    creator.progress = job.setStage
+    try:
+        graph = getattr(creator, builder)(params)
+    except (CypherError, KeyError):
+        raise ValueError("Invalid request.")
+    finally:
+        job.stats = creator.stats
+    job.setStage('layout')
+    if builder == 'createGraphQuery' and len(graph.edges()) == 0:
+        args['layout'] = 'Circular (OGDF)'
+    applyLayout(graph, args['layout'])
+    job.setStage('serialize')
+    return json.dumps(getJson(graph))
+
+
+def submit(builder, params, args):
+    job = jobs.submit(builder, buildGraph, builder, params, args)
+    if job is None:
+        return makeResponse("Too many jobs, retry later", 503)
+    return makeResponse(job.getStatus(), 202)
+
+
+class SubmitQueryGraph(Resource):
+    """
+       @api {post} /jobs/getQueryGraph Submit a query graph job
+       @apiName SubmitQueryGraph
+       @apiGroup Jobs
+       @apiDescription Build the graph of /getQueryGraph in background, same parameters
+       @apiParam {value} query
+       @apiParam {layout} tulip layout algorithm to apply
+       @apiSuccess {Job} job status with the id to poll
+    """
+    def post(self):
+        args = parser.parse_args()
+        return submit('createGraphQuery', args, args)
+
+
+class SubmitGraphLabelEdgeLabel(Resource):
+    """
+       @api {post} /jobs/getGraph/:label/:edge/label Submit a label-edge->label graph job
+       @apiName SubmitGraphLabelEdgeLabel
+       @apiGroup Jobs
+       @apiDescription Build the graph of /getGraph/:label/:edge/:label in background, same parameters
+       @apiSuccess {Job} job status with the id to poll
+    """
+    def post(self, label1, edge, label2):
+        args = parser.parse_args()
+        return submit('createLabelEdgeLabel', (label1, edge, label2, args), args)
+
+
+class SubmitGraphNeighboursById(Resource):
+    """
+       @api {post} /jobs/getGraphNeighboursById/:id/:edge/:label Submit a neighbours graph job
+       @apiName SubmitGraphNeighboursById
+       @apiGroup Jobs
+       @apiDescription Build the graph of /getGraphNeighboursById/:id/:edge/:label in background, same parameters
+       @apiSuccess {Job} job status with the id to poll
+    """
+    def post(self, id, edge, label):
+        args = parser.parse_args()
+        if not args['layout']:
+            args['layout'] = config['api']['default_layout']
+        return submit('createNeighboursById', (id, edge, label, args), args)
+
+
+class GetJob(Resource):
+    """
+       @api {get} /jobs/:id Poll a job
+       @apiName GetJob
+       @apiGroup Jobs
+       @apiDescription Return the state (queued, running, done, failed) and the current stage
+       (query, build, label, layout, serialize) of a job
+       @apiParam {String} id job id
+       @apiSuccess {Job} job status
+    """
+    def get(self, id):
+        job = jobs.get(id)
+        if job is None:
+            return makeResponse("Unknown or expired job", 404)
+        return makeResponse(job.getStatus(), 200)
+
+
+class GetJobResult(Resource):
+    """
+       @api {get} /jobs/:id/result Fetch a job result
+       @apiName GetJobResult
+       @apiGroup Jobs
+       @apiDescription Return the graph built by a finished job, the job status while it is running
+       @apiParam {String} id job id
+       @apiSuccess {Graph} Graph in json format.
+    """
+    def get(self, id):
+        job = jobs.get(id)
+        if job is None:
+            return makeResponse("Unknown or expired job", 404)
+        if job.state == 'failed':
+            return makeResponse(job.error, 400)
+        if job.state != 'done':
+            return makeResponse(job.getStatus(), 202)
+        return makeResponse(job.result, 200, raw=True)
@@ -3,6 +3,7 @@ import os
 
 from flask_restful import Resource, reqparse
 from routes.utils import makeResponse
+from graphtulip.layout import pool
 from tulip import *
 
 config = configparser.ConfigParser()
@@ -16,3 +17,16 @@ class GetLayoutAlgorithm(Resource):
         # return makeResponse(tlp.getLayoutAlgorithmPluginsList(), 200)
         list = ['FM^3 (OGDF)', 'Circular (OGDF)',  'Balloon (OGDF)',  'Sugiyama (OGDF)', 'Tree Leaf']
         return makeResponse(list, 200)
+
+
+class GetLayoutPool(Resource):
+    """
+       @api {get} /layoutPool Get the layout worker pool state
+       @apiName GetLayoutPool
+       @apiGroup Layout
+       @apiDescription Return workers, queue limit, deadline and counters (jobs, rejected, timeouts, errors, started and
+       recycled worker processes) of the layout workers
+       @apiSuccess {Object} result pool statistics
+    """
+    def get(self):
+        return makeResponse(pool.getStats(), 200)
@@ -1,6 +1,8 @@
 import glob
 from routes.tulipr.tulip_create import *
-from routes.tulipr.tulip_layout import GetLayoutAlgorithm
+from routes.tulipr.tulip_layout import GetLayoutAlgorithm, GetLayoutPool
+from routes.tulipr.tulip_jobs import SubmitQueryGraph, SubmitGraphLabelEdgeLabel, SubmitGraphNeighboursById, GetJob, \
+    GetJobResult
 
 
 def add_tulip_routes(api):
@@ -11,5 +13,13 @@ def add_tulip_routes(api):
     api.add_resource(GetGraphLabelEdgeLabel, '/getGraph/<string:label1>/<string:edge>/<string:label2>')
     api.add_resource(GetGraphNeighboursById, '/getGraphNeighboursById/<int:id>/<string:edge>/<string:label>')
 
+    # Jobs
+    api.add_resource(SubmitQueryGraph, '/jobs/getQueryGraph')
+    api.add_resource(SubmitGraphLabelEdgeLabel, '/jobs/getGraph/<string:label1>/<string:edge>/<string:label2>')
+    api.add_resource(SubmitGraphNeighboursById, '/jobs/getGraphNeighboursById/<int:id>/<string:edge>/<string:label>')
+    api.add_resource(GetJob, '/jobs/<string:id>')
+    api.add_resource(GetJobResult, '/jobs/<string:id>/result')
+
     # Layout
     api.add_resource(GetLayoutAlgorithm, '/layoutAlgorithm')
+    api.add_resource(GetLayoutPool, '/layoutPool')
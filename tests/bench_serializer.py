@@ -0,0 +1,32 @@
+"""
+Time the legacy getJson against GraphSerializer on generated graphs:
+
+    python -m tests.bench_serializer [nodes ...]
+"""
+import json
+import sys
+import time
+
+from routes.serializer import GraphSerializer
+from tests.graphs import makeGraph
+from tests.legacy import getJson
+
+
+def timeit(serialize, graph):
+    start = time.time()
+    text = json.dumps(serialize(graph))
+    return time.time() - start, text
+
+
+def main(sizes):
+    for size in sizes:
+        graph = makeGraph(size, 2 * size)
+        legacy, expected = timeit(getJson, graph)
+        typed, text = timeit(lambda g: GraphSerializer(g).toDict(), graph)
+        print("%8d nodes %8d edges  getJson %8.3fs  GraphSerializer %8.3fs  x%.1f  %s" %
+              (size, 2 * size, legacy, typed, legacy / typed if typed else 0,
+               'identical' if text == expected else 'DIFFERENT'))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [1000, 5000, 10000])
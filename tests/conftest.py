@@ -0,0 +1,94 @@
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+# The api modules read config.ini from the working directory when imported: run them on the example config
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+workdir = tempfile.mkdtemp()
+shutil.copy(os.path.join(root, 'config.example.ini'), os.path.join(workdir, 'config.ini'))
+os.chdir(workdir)
+
+
+class Counters(object):
+    def __init__(self, nodes_created):
+        super(Counters, self).__init__()
+        self.nodes_created = nodes_created
+
+
+class Summary(object):
+    def __init__(self, nodes_created):
+        super(Summary, self).__init__()
+        self.counters = Counters(nodes_created)
+
+
+class Result(object):
+    def __init__(self, records, nodes_created=0):
+        super(Result, self).__init__()
+        self.records = records
+        self.summary = Summary(nodes_created)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def single(self):
+        return self.records[0] if self.records else Record()
+
+    def consume(self):
+        return self.summary
+
+
+class Record(dict):
+    # Keys the stubbed statement did not answer read as empty lists
+    def __missing__(self, key):
+        return []
+
+
+class Recorder(object):
+    """
+    Stand-in for connector.neo4j.query_neo4j: records every statement and answers with the records
+    `respond(text, parameters)` returns (none by default), and the nodes_created of `created(text, parameters)`.
+    """
+    def __init__(self, respond=None, created=None):
+        super(Recorder, self).__init__()
+        self.statements = []
+        self.respond = respond or (lambda text, parameters: [])
+        self.created = created or (lambda text, parameters: 0)
+
+    def __call__(self, request, parameters=None):
+        self.statements.append((request, parameters or {}))
+        return Result([Record(r) for r in self.respond(request, parameters or {})],
+                      self.created(request, parameters or {}))
+
+    @property
+    def texts(self):
+        return [text for text, parameters in self.statements]
+
+    def clear(self):
+        del self.statements[:]
+
+
+@contextmanager
+def bound(*args):
+    yield None
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    from connector import neo4j
+    recorder = Recorder()
+    monkeypatch.setattr(neo4j, 'query_neo4j', recorder)
+    monkeypatch.setattr(neo4j, 'stream_neo4j', recorder)
+    monkeypatch.setattr(neo4j, 'session', bound)
+    monkeypatch.setattr(neo4j, 'transaction', bound)
+    return recorder
+
+
+@pytest.fixture
+def client():
+    from app import app
+    return app.test_client()
@@ -0,0 +1,39 @@
+import random
+
+from tulip import tlp
+
+
+def makeGraph(nb_nodes, nb_edges, seed=0):
+    # A graph shaped like the ones of graphtulip.createtlp, with the values the serializer escapes or skips
+    rand = random.Random(seed)
+    graph = tlp.newGraph()
+    property_id = graph.getStringProperty("neo4j_id")
+    property_label = graph.getStringProperty("name")
+    property_labels = graph.getStringProperty("labels")
+    property_color = graph.getColorProperty("viewColor")
+    property_size = graph.getSizeProperty("viewSize")
+    property_layout = graph.getLayoutProperty("viewLayout")
+    property_body = graph.getStringProperty("body")
+    property_timestamp = graph.getStringProperty("timestamp")
+    graph.getStringProperty("unused")
+    nodes = []
+    for i in range(nb_nodes):
+        node = graph.addNode()
+        property_id[node] = str(i)
+        property_label[node] = 'node "%s"' % i if i % 7 else ''
+        property_labels[node] = 'Node:Person' if i % 2 else 'Node:Post'
+        property_color[node] = tlp.Color(rand.randint(0, 255), rand.randint(0, 255), rand.randint(0, 255))
+        property_size[node] = tlp.Size(rand.randint(1, 10), rand.randint(1, 10), 0)
+        property_layout[node] = tlp.Coord(rand.uniform(-500, 500), rand.uniform(-500, 500), 0)
+        if i % 5 == 0:
+            property_body[node] = 'line\n"quoted"\r\tend'
+        nodes.append(node)
+    for i in range(nb_edges):
+        edge = graph.addEdge(rand.choice(nodes), rand.choice(nodes))
+        property_id[edge] = str(nb_nodes + i)
+        property_label[edge] = 'edge %s' % i if i % 3 else ''
+        property_color[edge] = tlp.Color(rand.randint(0, 255), rand.randint(0, 255), rand.randint(0, 255))
+        if i % 4 == 0:
+            property_timestamp[edge] = str(1466000000000 + i)
+            property_body[edge] = 'a\tb\n"c"'
+    return graph
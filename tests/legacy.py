@@ -0,0 +1,86 @@
+"""
+The getJson of routes.utils before GraphSerializer, kept as the reference output for the serializer tests
+and benchmark.
+"""
+
+
+def getJson(graph, params={'edge_type': 'arrow'}):
+    property_id = graph.getStringProperty("neo4j_id")
+
+    # edges
+    edges = []
+    for edge in graph.getEdges():
+        # edge properties
+        e = {"source": property_id.getNodeValue(graph.source(edge)), "target": property_id.getNodeValue(graph.target(edge))}
+        for prop in graph.getObjectProperties():
+            # edge color
+            if prop.getName() == "viewColor":
+                colors = prop.getEdgeStringValue(edge)[1:][:-1].split(',')
+                e["color"] = 'rgb(' + colors[0] + ',' + colors[1] + ',' + colors[2] + ')'
+            # edge label
+            elif prop.getName() == "name":
+                if prop.getEdgeStringValue(edge):
+                    label = prop.getEdgeStringValue(edge).replace('"', '\\\"')
+                    e["label"] = label
+                    # else:
+                    # json += '%s"label":"edge%s", %s' % (hr_2t, edge.id, hr_n)
+            elif prop.getName() == "neo4j_id":
+                e["id"] = prop.getEdgeValue(edge)
+            elif prop.getName() == "timestamp":
+                if prop.getEdgeValue(edge):
+                    e["timestamp"] = prop.getEdgeValue(edge)
+            # other
+            elif prop.getEdgeDefaultStringValue() != prop.getEdgeStringValue(edge) \
+                    and prop.getEdgeStringValue(edge):
+                value = prop.getEdgeStringValue(edge)\
+                    .replace('"', '\\\"')\
+                    .replace("\n", "\\n")\
+                    .replace("\r", "\\r")\
+                    .replace("\t", "\\t")
+                e[prop.getName()] = value
+        e["type"] = params['edge_type']
+        if not e in edges:
+            edges.append(e)
+
+    # nodes
+    nodes = []
+    graph.getLayoutProperty("viewLayout").center()
+    for node in graph.getNodes():
+        n = {}
+        for prop in graph.getObjectProperties():
+            # node color
+            if prop.getName() == "viewColor":
+                colors = prop.getNodeStringValue(node)[1:].split(',')
+                n["color"] = 'rgb(' + colors[0] + ',' + colors[1] + ',' + colors[2] + ')'
+            # node label
+            elif prop.getName() == "name":
+                if prop.getNodeStringValue(node):
+                    label = prop.getNodeStringValue(node).replace('"', '\\\"')
+                    n["label"] = label
+                else:
+                    n["label"] = "node" + str(node.id)
+            # node size
+            elif prop.getName() == "viewSize":
+                size = prop.getNodeStringValue(node)[1:-1].split(',')
+                size = (int(size[0]) + int(size[1])) / 2
+                n["size"] = size
+            # node layout
+            elif prop.getName() == "viewLayout":
+                coord = prop.getNodeStringValue(node)[1:-1].split(',')
+                n["x"] = float(coord[0])
+                n["y"] = float(coord[1])
+            elif prop.getName() == "neo4j_id":
+                n["id"] = prop.getNodeValue(node)
+            elif prop.getName() == "viewSelection":
+                n["viewSelection"] = prop.getNodeValue(node)
+            # other
+            elif prop.getNodeDefaultStringValue() != prop.getNodeStringValue(node) \
+                    and prop.getNodeStringValue(node):
+                n[prop.getName()] = prop.getNodeStringValue(node)\
+                    .replace('"', '\\\"')\
+                    .replace("\n", "")\
+                    .replace("\r", "")\
+                    .replace("\t", "")
+        if not n in nodes:
+            nodes.append(n)
+    return {"edges": edges, "nodes": nodes}
@@ -0,0 +1,15 @@
+from routes.utils import assetUrl, SIGMA_ASSETS
+
+
+def test_asset_urls_are_absolute_and_versioned(client):
+    with client.application.test_request_context(base_url='http://api.example:5000'):
+        url = assetUrl(SIGMA_ASSETS[0])
+    assert url.startswith('http://api.example:5000/static/sigma/sigma.min.js?v=')
+
+
+def test_assets_are_served(client):
+    with client.application.test_request_context():
+        url = assetUrl(SIGMA_ASSETS[0])
+    response = client.get(url.replace('http://localhost', ''))
+    assert response.status_code == 200
+    assert response.cache_control.max_age == 31536000
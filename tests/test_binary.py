@@ -0,0 +1,54 @@
+import pytest
+
+from routes.binary import getBinary, decodeBinary, HEADER
+from tests.graphs import makeGraph
+
+
+def test_round_trip():
+    graph = makeGraph(50, 80)
+    data = getBinary(graph)
+    assert len(data) % 4 == 0
+    decoded = decodeBinary(data)
+
+    property_id = graph.getStringProperty("neo4j_id")
+    property_label = graph.getStringProperty("name")
+    color = graph.getColorProperty("viewColor")
+    size = graph.getSizeProperty("viewSize")
+    layout = graph.getLayoutProperty("viewLayout")
+    nodes = dict((n["id"], n) for n in decoded["nodes"])
+    assert len(nodes) == graph.numberOfNodes() == len(decoded["nodes"])
+    for node in graph.getNodes():
+        n = nodes[property_id[node]]
+        assert n["label"] == (property_label[node] or "node" + str(node.id))
+        assert (n["x"], n["y"]) == (layout[node].getX(), layout[node].getY())
+        s = size[node]
+        assert n["size"] == (int(s.getW()) + int(s.getH())) / 2
+        c = color[node]
+        assert n["color"] == 'rgb(%s,%s,%s)' % (c.getR(), c.getG(), c.getB())
+
+    edges = dict((e["id"], e) for e in decoded["edges"])
+    assert len(edges) == graph.numberOfEdges() == len(decoded["edges"])
+    for edge in graph.getEdges():
+        e = edges[property_id[edge]]
+        assert e["label"] == property_label[edge]
+        assert e["source"] == property_id[graph.source(edge)]
+        assert e["target"] == property_id[graph.target(edge)]
+        c = color[edge]
+        assert e["color"] == 'rgb(%s,%s,%s)' % (c.getR(), c.getG(), c.getB())
+
+
+def test_duplicate_ids_are_sent_once():
+    graph = makeGraph(3, 0)
+    graph.getStringProperty("neo4j_id")[graph.addNode()] = "0"
+    assert [n["id"] for n in decodeBinary(getBinary(graph))["nodes"]] == ["0", "1", "2"]
+
+
+def test_header():
+    graph = makeGraph(4, 5)
+    magic, version, flags, n, m, strings, blob = HEADER.unpack_from(getBinary(graph), 0)
+    assert (magic, version, n, m) == (b'GRYB', 1, 4, 5)
+
+
+def test_rejects_other_formats():
+    with pytest.raises(ValueError):
+        decodeBinary(HEADER.pack(b'GRYB', 2, 0, 0, 0, 0, 0))
@@ -0,0 +1,83 @@
+import zlib
+
+from tulip import tlp
+
+from graphtulip.createtlp import CreateTlp
+from routes.utils import getCsv
+
+ARGS = {'format': 'csv', 'target': 'nodes', 'color_node': 'rgb(1,2,3)'}
+
+
+def respond(text, parameters):
+    ids = parameters.get('ids', [])
+    if 'Link:Prop' in text:
+        rows = [{'id': 1, 'pid': 10, 'labels': ['Property', 'title'], 'value': 'Ada'},
+                {'id': 1, 'pid': 11, 'labels': ['Property', 'title'], 'value': "O'Brien"},
+                {'id': 1, 'pid': 12, 'labels': ['Property', 'age'], 'value': 36},
+                {'id': 2, 'pid': 13, 'labels': ['Property', 'title'], 'value': 'Bob "B"'}]
+    else:
+        rows = [{'id': 1, 'labels': ['Attribute', 'Node', 'Person'], 'type': 'knows', 'attrs': [20, 21]},
+                {'id': 2, 'labels': ['Attribute', 'Time'], 'type': 'born', 'attrs': [30]}]
+    return [row for row in rows if row['id'] in ids]
+
+
+def hydrated(recorder):
+    recorder.respond = respond
+    creator = CreateTlp()
+    for id in (1, 2, 3):
+        creator.addNode({'id_node': id, 'labels_node': ['Person'], 'label_node': 'p%s' % id}, 'node', ARGS)
+    creator.hydrateProperties()
+    return creator.tulip_graph
+
+
+def test_hydrated_cells(recorder):
+    graph = hydrated(recorder)
+    assert len(recorder.statements) == 2
+    nodes = list(graph.getNodes())
+    # str() of the value list without its brackets, quotes in strings blanked
+    assert graph['title'][nodes[0]] == "'Ada', 'O Brien'"
+    assert graph['title'][nodes[1]] == '\'Bob "B"\''
+    assert graph['age'][nodes[0]] == '36'
+    assert graph['Person:knows'][nodes[0]] == '20, 21'
+    assert not graph.existProperty('Time:born')
+    assert graph['title'][nodes[2]] == ''
+
+
+def test_nodes_csv(recorder):
+    graph = hydrated(recorder)
+    assert ''.join(getCsv(graph, 'nodes')) == (
+        '"Person:knows","age","labels","name","neo4j_id","title"\n'
+        '"20, 21","36","[\'Person\']","p1","1","\'Ada\', \'O Brien\'"\n'
+        ',,"[\'Person\']","p2","2","\'Bob ""B""\'"\n'
+        ',,"[\'Person\']","p3","3",\n')
+
+
+def typed():
+    graph = tlp.newGraph()
+    a, b = graph.addNode(), graph.addNode()
+    edge = graph.addEdge(a, b)
+    graph.getStringProperty('body')[a] = 'line\n"quoted"'
+    score = graph.getDoubleProperty('score')
+    score[a] = 1.5
+    score[b] = 2
+    score[edge] = 123456789.123
+    graph.getIntegerProperty('rank')[a] = -3
+    graph.getBooleanProperty('flag')[b] = True
+    graph.getLayoutProperty('viewLayout')[a] = tlp.Coord(1, 2, 0)
+    return graph
+
+
+def test_typed_csv():
+    # Bytes of tulip CSV Export with {'Type of elements': target, 'Field separator': ' , '}
+    assert ''.join(getCsv(typed(), 'nodes')) == (
+        '"body","flag","rank","score"\n'
+        '"line\n""quoted""",false,-3,1.5\n'
+        ',true,0,2\n')
+    assert ''.join(getCsv(typed(), 'edges')) == (
+        '"body","flag","rank","score"\n'
+        ',false,0,1.23457e+08\n')
+
+
+def test_gzip_csv():
+    data = b''.join(getCsv(typed(), 'nodes', compress=True))
+    assert zlib.decompress(data, 31).decode('utf-8') == ''.join(getCsv(typed(), 'nodes'))
@@ -0,0 +1,41 @@
+import json
+import zlib
+
+import pytest
+
+from routes.utils import finalizeResponse, makeStreamResponse, makeResponse
+
+nodes = [{'id': str(i)} for i in range(2000)]
+responses = {
+    'stream': lambda: makeStreamResponse(iter(['{"nodes": [', ', '.join(json.dumps(n) for n in nodes), ']}'])),
+    'json': lambda: makeResponse({'nodes': nodes}),
+}
+
+
+def finalize(client, kind, encoding):
+    headers = {'Accept-Encoding': encoding} if encoding else {}
+    with client.application.test_request_context('/', headers=headers):
+        response = finalizeResponse(responses[kind]())
+        return response, b''.join(response.iter_encoded())
+
+
+@pytest.mark.parametrize('kind', sorted(responses))
+def test_gzip(client, kind):
+    response, data = finalize(client, kind, 'gzip')
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(zlib.decompress(data, 31).decode('utf-8')) == {'nodes': nodes}
+
+
+@pytest.mark.parametrize('kind', sorted(responses))
+def test_brotli_only_client(client, kind):
+    brotli = pytest.importorskip('brotli')
+    response, data = finalize(client, kind, 'br')
+    assert response.headers['Content-Encoding'] == 'br'
+    assert json.loads(brotli.decompress(data).decode('utf-8')) == {'nodes': nodes}
+
+
+@pytest.mark.parametrize('kind', sorted(responses))
+def test_identity(client, kind):
+    response, data = finalize(client, kind, None)
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(data.decode('utf-8')) == {'nodes': nodes}
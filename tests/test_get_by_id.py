@@ -0,0 +1,295 @@
+import json
+import re
+
+import pytest
+
+from connector import cypher
+from routes.generics.getters import elementQuery
+
+# 1: a node with two properties, one carrying a property attribute, and three typed attribute links
+# 2: a node without properties nor attributes
+# 3: an edge (reified Link node) with a property and a date
+# 4: a node linked twice to the same property, each link carrying its own property attribute
+NODES = {1: ['Person'], 2: ['Person'], 3: ['Link', 'Knows'], 4: ['Person'],
+         20: ['Node', 'Attribute', 'Document'], 21: ['Node', 'Attribute', 'Document'], 22: ['Node', 'Time', 'Day']}
+PROPERTIES = {10: (['Property', 'name'], 'alice'), 13: (['Property', 'age'], 30), 30: (['Property', 'since'], 2010),
+              40: (['Property', 'name'], 'bob')}
+PROPERTY_LINKS = [(1, 11, 10), (1, 14, 13), (3, 31, 30), (4, 41, 40), (4, 42, 40)]
+PROPERTY_ATTRIBUTES = [(11, 12, 20, 'source'), (31, 32, 21, 'source'), (41, 43, 20, 'source'), (42, 44, 21, 'cited')]
+ATTRIBUTES = [(1, 15, 20, 'author'), (1, 16, 21, 'author'), (1, 17, 22, 'date'), (3, 33, 22, 'date')]
+LINK_TYPES = dict((la, type) for l, la, a, type in PROPERTY_ATTRIBUTES + ATTRIBUTES)
+
+ELEMENT = "UNWIND $ids AS id MATCH (n) WHERE ID(n) = id"
+PROPERTY_MATCH = " OPTIONAL MATCH (n)--(l:Link:Prop)--(p:Property)"
+KEYS_FILTER = " WHERE ANY(k IN labels(p) WHERE k IN $keys)"
+PROPERTY_ATTRIBUTES_MATCH = " OPTIONAL MATCH (l)-->(la:Link:Attr)-->(pa:Node)"
+PROPERTY_ATTRIBUTES_COLLECT = (" WITH n, p, collect(DISTINCT CASE WHEN la IS NULL THEN NULL"
+                               " ELSE {type: la.type, aid: ID(pa), laid: ID(la)} END) AS attrs")
+PROPERTIES_COLLECT = (" WITH n, collect(CASE WHEN p IS NULL THEN NULL"
+                      " ELSE {labels: labels(p), value: p.value, pid: ID(p), attrs: attrs} END) AS properties")
+NO_PROPERTIES = " WITH n, [] AS properties"
+ATTRIBUTES_MATCH = " OPTIONAL MATCH (n)-[:HAS]->(l:Link:Attr)-[:IS]->(a)"
+ATTRIBUTES_COLLECT = (" WITH n, properties, collect(DISTINCT CASE WHEN a IS NULL THEN NULL"
+                      " ELSE {type: l.type, laid: ID(l), aid: ID(a), labels: labels(a)} END) AS attributes")
+NO_ATTRIBUTES = " WITH n, properties, [] AS attributes"
+RETURN = " RETURN ID(n) as id, properties, attributes"
+
+
+def group(rows, keys, name, value):
+    # WITH <keys>, collect(<value>) AS <name>: one row per distinct keys in first seen order, nulls not collected
+    groups = []
+    for row in rows:
+        found = [g for g in groups if all(g[k] == row[k] for k in keys)]
+        if not found:
+            found = [dict((k, row[k]) for k in keys)]
+            found[0][name] = []
+            groups.append(found[0])
+        item = value(row)
+        if item is not None:
+            found[0][name].append(item)
+    return groups
+
+
+def distinct(rows, name):
+    for row in rows:
+        row[name] = [item for i, item in enumerate(row[name]) if item not in row[name][:i]]
+    return rows
+
+
+def optional(rows, matches):
+    # OPTIONAL MATCH: one row per match, or the row with the new variables null
+    result = []
+    for row in rows:
+        found = matches(row)
+        for match in found or [dict((k, None) for k in matches(None))]:
+            result.append(dict(row, **match))
+    return result
+
+
+def propertyMatches(keys=None):
+    def matches(row):
+        if row is None:
+            return {'l': None, 'p': None}
+        return [{'l': l, 'p': p} for node, l, p in PROPERTY_LINKS
+                if node == row['n'] and (keys is None or set(PROPERTIES[p][0]) & set(keys))]
+    return matches
+
+
+def propertyAttributeMatches(row):
+    if row is None:
+        return {'la': None, 'pa': None}
+    return [{'la': la, 'pa': pa} for l, la, pa, type in PROPERTY_ATTRIBUTES if l == row['l'] and 'Node' in NODES[pa]]
+
+
+def attributeMatches(row):
+    if row is None:
+        return {'l': None, 'a': None}
+    return [{'l': l, 'a': a} for node, l, a, type in ATTRIBUTES if node == row['n']]
+
+
+def evaluate(text, parameters):
+    """
+    Run the elementQuery statement on the graph above clause by clause with the semantics of neo4j:
+    OPTIONAL MATCH rows with nulls, grouping keys of WITH, collect skipping nulls, DISTINCT.
+    Any clause this evaluator does not know fails the test.
+    """
+    clauses = [
+        (ELEMENT, lambda rows: [{'n': id} for id in parameters['ids'] if id in NODES]),
+        (PROPERTY_MATCH + KEYS_FILTER, lambda rows: optional(rows, propertyMatches(parameters['keys']))),
+        (PROPERTY_MATCH, lambda rows: optional(rows, propertyMatches())),
+        (PROPERTY_ATTRIBUTES_MATCH, lambda rows: optional(rows, propertyAttributeMatches)),
+        (PROPERTY_ATTRIBUTES_COLLECT, lambda rows: distinct(group(rows, ['n', 'p'], 'attrs', lambda row: None if row['la'] is None else
+                                                                  {'type': LINK_TYPES[row['la']], 'aid': row['pa'], 'laid': row['la']}), 'attrs')),
+        (PROPERTIES_COLLECT, lambda rows: group(rows, ['n'], 'properties', lambda row: None if row['p'] is None else
+                                                {'labels': PROPERTIES[row['p']][0], 'value': PROPERTIES[row['p']][1],
+                                                 'pid': row['p'], 'attrs': row['attrs']})),
+        (NO_PROPERTIES, lambda rows: [dict(row, properties=[]) for row in rows]),
+        (ATTRIBUTES_MATCH, lambda rows: optional(rows, attributeMatches)),
+        (ATTRIBUTES_COLLECT, lambda rows: distinct(group(rows, ['n', 'properties'], 'attributes', lambda row: None if row['a'] is None else
+                                                         {'type': LINK_TYPES[row['l']], 'laid': row['l'], 'aid': row['a'],
+                                                          'labels': NODES[row['a']]}), 'attributes')),
+        (NO_ATTRIBUTES, lambda rows: [dict(row, attributes=[]) for row in rows]),
+    ]
+    rows = None
+    while not text.startswith(" RETURN "):
+        clause, apply = [(c, a) for c, a in clauses if text.startswith(c)][0]
+        rows = apply(rows)
+        text = text[len(clause):]
+    # The RETURN columns: "expression as name" or a variable
+    columns = []
+    for column in text[len(" RETURN "):].split(', '):
+        expression, name = column.split(' as ') if ' as ' in column else (column, column)
+        columns.append((name, expression))
+    records = []
+    for row in rows:
+        record = {}
+        for name, expression in columns:
+            variable = re.match(r'^ID\((\w+)\)$', expression)
+            record[name] = row[variable.group(1)] if variable else row[expression]
+        records.append(record)
+    return records
+
+
+def properties(id, keys):
+    for node, link, pid in PROPERTY_LINKS:
+        labels, value = PROPERTIES[pid]
+        if node == id and (keys is None or set(labels) & set(keys)):
+            yield link, pid, list(labels), value
+
+
+def attributes(id, label=None):
+    for node, link, aid, type in ATTRIBUTES:
+        if node == id and (label is None or set(label.split(':')).issubset(NODES[aid])):
+            yield link, aid, type
+
+
+def respond(text, parameters):
+    # The records neo4j answers to the statements of the legacy GetById, elementQuery goes through evaluate
+    if text.startswith(ELEMENT):
+        return evaluate(text, parameters)
+    if text == "MATCH (n) WHERE ID(n) = $id RETURN labels(n) as labels":
+        return [{'labels': list(NODES[parameters['id']])}]
+    if text.startswith("MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id"):
+        # Grouped by labels, value and pid, collect(id(la)) skipping the null la of the OPTIONAL MATCH
+        records = []
+        for link, pid, labels, value in properties(parameters['id'], parameters.get('keys')):
+            laid = [la for l, la, aid, type in PROPERTY_ATTRIBUTES if l == link]
+            found = [record for record in records if record['pid'] == pid]
+            if found:
+                found[0]['laid'].extend(laid)
+            else:
+                records.append({'labels': labels, 'value': value, 'pid': pid, 'laid': laid})
+        return records
+    if text.startswith("MATCH (la:Link:Attr)-->(a:Node) WHERE ID(la) = $id"):
+        return [{'type': type, 'aid': aid} for l, la, aid, type in PROPERTY_ATTRIBUTES if la == parameters['id']]
+    if "COLLECT(DISTINCT labels(k))" in text:
+        found = []
+        for link, aid, type in attributes(parameters['id']):
+            if NODES[aid] not in found:
+                found.append(list(NODES[aid]))
+        return [{'attr': found}]
+    if text.startswith("MATCH (n) WHERE ID(n) = $id WITH n MATCH (n)-[:HAS]->(l:Link:Attr)-[:IS]->(a:"):
+        by_type = {}
+        for link, aid, type in attributes(parameters['id'], re.search(r'\(a:([\w:]+)\)', text).group(1)):
+            by_type.setdefault(type, {'type': type, 'laid': [], 'aid': []})
+            by_type[type]['laid'].append(link)
+            by_type[type]['aid'].append(aid)
+        return list(by_type.values())
+    raise AssertionError("Unexpected statement: %s" % text)
+
+
+def legacyGetById(id, keys, attrs):
+    # GetById.read before elementQuery, with its request arguments as parameters
+    query = cypher.Query("MATCH (n) WHERE ID(n) = $id RETURN labels(n) as labels", id=id)
+    query.run().single()['labels']
+    element = {'id': id}
+    result = []
+    if keys:
+        query = cypher.Query("MATCH (n)--(l:Link:Prop)--(p:Property) WHERE ID(n) = $id", id=id)
+        if '*' not in keys:
+            query.add(" AND ANY(k IN labels(p) WHERE k IN $keys)", keys=keys)
+        query.add(" OPTIONAL MATCH (l)-->(la:Link:Attr)-->(a:Node)")
+        query.add(" RETURN labels(p) as labels, p.value as value, ID(p) as pid, collect(id(la)) as laid")
+        result = query.run()
+    for record in result:
+        label = record['labels']
+        label.remove('Property')
+        if not label[0] in element.keys():
+            element[label[0]] = []
+        prop = {"pid": record['pid'], "value": record['value']}
+        if record['laid']:
+            prop['attrs'] = []
+            for r in record['laid']:
+                q = cypher.Query("MATCH (la:Link:Attr)-->(a:Node) WHERE ID(la) = $id RETURN la.type as type, ID(a) as aid",
+                                 id=r)
+                for rec in q.run():
+                    prop['attrs'].append({'type': rec['type'], 'aid': rec['aid']})
+        element[label[0]].append(prop)
+    if attrs and '*' in attrs:
+        attrs = []
+        q = cypher.Query("MATCH (n)-[:HAS]->(:Link:Attr)-[:IS]->(k)")
+        q.add(" WHERE ID(n) = $id RETURN COLLECT(DISTINCT labels(k)) as attr", id=id)
+        for a in q.run().single()['attr']:
+            for generic in ('Attribute', 'Node', 'Geo', 'Time', 'SubGraph'):
+                if generic in a:
+                    a.remove(generic)
+            attrs.append(a[0])
+    if attrs:
+        for attribute in attrs:
+            query = cypher.Query("MATCH (n) WHERE ID(n) = $id", id=id)
+            query.add(" WITH n")
+            query.add(" MATCH (n)-[:HAS]->(l:Link:Attr)-[:IS]->(a:%s)", cypher.label(attribute))
+            query.add(" RETURN l.type as type, collect(DISTINCT ID(l)) as laid, collect(DISTINCT ID(a)) as aid")
+            for record in query.run():
+                elements = []
+                for i, e in enumerate(record['aid']):
+                    elements.append({'id': e, 'laid': record['laid'][i]})
+                element[attribute + ':' + record['type']] = elements
+    return element
+
+
+@pytest.mark.parametrize('keys, attrs, text, parameters', [
+    (None, None, ELEMENT + NO_PROPERTIES + NO_ATTRIBUTES + RETURN, {}),
+    (['*'], None, ELEMENT + PROPERTY_MATCH + PROPERTY_ATTRIBUTES_MATCH + PROPERTY_ATTRIBUTES_COLLECT + PROPERTIES_COLLECT
+     + NO_ATTRIBUTES + RETURN, {}),
+    (['name', 'age'], None, ELEMENT + PROPERTY_MATCH + KEYS_FILTER + PROPERTY_ATTRIBUTES_MATCH + PROPERTY_ATTRIBUTES_COLLECT
+     + PROPERTIES_COLLECT + NO_ATTRIBUTES + RETURN, {'keys': ['name', 'age']}),
+    (None, ['Document'], ELEMENT + NO_PROPERTIES + ATTRIBUTES_MATCH + ATTRIBUTES_COLLECT + RETURN, {}),
+    (['*'], ['*'], ELEMENT + PROPERTY_MATCH + PROPERTY_ATTRIBUTES_MATCH + PROPERTY_ATTRIBUTES_COLLECT + PROPERTIES_COLLECT
+     + ATTRIBUTES_MATCH + ATTRIBUTES_COLLECT + RETURN, {}),
+])
+def test_statement(keys, attrs, text, parameters):
+    query = elementQuery(keys, attrs)
+    assert query.text == text
+    assert query.parameters == parameters
+
+
+@pytest.mark.parametrize('id', [1, 2, 3, 4])
+@pytest.mark.parametrize('keys, attrs', [
+    (None, None),
+    (['*'], None),
+    (['name'], None),
+    (['name', 'age'], ['Document']),
+    (None, ['*']),
+    (['*'], ['*']),
+    (['*'], ['Day', 'Document']),
+])
+def test_same_element_as_legacy_GetById(recorder, client, id, keys, attrs):
+    recorder.respond = respond
+    expected = legacyGetById(id, keys, attrs)
+    recorder.clear()
+    query = '&'.join(['keys=%s' % k for k in keys or []] + ['attrs=%s' % a for a in attrs or []])
+    response = client.get('/get/%s?%s' % (id, query))
+    assert response.status_code == 200
+    assert json.loads(response.data.decode('utf-8')) == json.loads(json.dumps(expected))
+    assert len(recorder.statements) == 1
+    assert recorder.statements[0][1]['ids'] == [id]
+
+
+def test_null_rows_of_elements_without_properties_nor_attributes():
+    records = evaluate(elementQuery(['*'], ['*']).text, {'ids': [2]})
+    assert records == [{'id': 2, 'properties': [], 'attributes': []}]
+
+
+def test_one_property_per_property_node():
+    # Two links to the same property: one property with the attributes of both links
+    record = evaluate(elementQuery(['*'], None).text, {'ids': [4]})[0]
+    assert [(p['pid'], sorted(a['laid'] for a in p['attrs'])) for p in record['properties']] == [(40, [43, 44])]
+
+
+def test_many_ids(recorder, client):
+    recorder.respond = respond
+    expected = legacyGetById(3, ['*'], ['*'])
+    recorder.clear()
+    response = client.get('/getByIds/?ids=1&ids=3&ids=1&ids=99&keys=*&attrs=*')
+    elements = json.loads(response.data.decode('utf-8'))
+    assert sorted(elements) == ['1', '3', '99']
+    assert elements['99'] is None
+    assert elements['3'] == json.loads(json.dumps(expected))
+    assert len(recorder.statements) == 1
+    assert sorted(recorder.statements[0][1]['ids']) == [1, 3, 99]
+
+
+def test_unknown_id(recorder, client):
+    recorder.respond = respond
+    assert client.get('/get/99?keys=*').status_code == 400
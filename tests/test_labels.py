@@ -0,0 +1,94 @@
+import json
+import threading
+
+import pytest
+
+from connector.labels import stats
+
+
+@pytest.fixture
+def snapshot(monkeypatch):
+    monkeypatch.setattr(stats, 'combos', {('Person',): 5, ('Link', 'Prop'): 4, ('Name', 'Property'): 3,
+                                          ('Attr', 'Link'): 2, ('Attribute', 'Node', 'Place'): 2})
+    monkeypatch.setattr(stats, 'stale', False)
+    monkeypatch.setattr(stats, 'wake', threading.Event())
+    monkeypatch.setattr(stats, 'start', lambda: None)
+    return stats
+
+
+def post(client, url, body):
+    return client.post(url, data=json.dumps(body), content_type='application/json')
+
+
+def test_reads_come_from_the_snapshot(recorder, client, snapshot):
+    counts = json.loads(client.get('/countLabels/').data.decode('utf-8'))
+    assert counts == {'Person': 5, 'Link': 6, 'Prop': 4, 'Name': 3, 'Property': 3, 'Attr': 2,
+                      'Attribute': 2, 'Node': 2, 'Place': 2}
+    assert sorted(json.loads(client.get('/getLabels/').data.decode('utf-8'))) == sorted(counts)
+    client.get('/getLabelsHierarchy/')
+    assert not recorder.statements
+
+
+def test_create_node_adds_its_labels(recorder, client, snapshot):
+    recorder.respond = lambda text, parameters: [{'id': 7}]
+    post(client, '/createNode/', {'labels': ['Person']})
+    assert snapshot.combos[('Person',)] == 6
+    assert not snapshot.stale
+
+
+def test_create_node_with_properties_invalidates(recorder, client, snapshot):
+    recorder.respond = lambda text, parameters: [{'id': 7}]
+    post(client, '/createNode/', {'labels': ['Person'], 'Name': [{'pid': -1, 'value': 'alice'}]})
+    assert snapshot.combos[('Person',)] == 6
+    assert snapshot.stale
+
+
+def test_delete_removes_the_deleted_labels(recorder, client, snapshot):
+    deleted = {'(la:Link:Attr)': [['Link', 'Attr']], '(pl:Prop)--(p:Property)': [['Link', 'Prop']] * 2,
+               'NOT (p)--()': [['Property', 'Name']], '(al:Attr)': [['Link', 'Attr']], 'collect(DISTINCT n)': [['Person']]}
+
+    def respond(text, parameters):
+        labels = [labels for part, labels in deleted.items() if part in text][0]
+        return [{'count': len(labels), 'labels': labels, 'pids': [3]}]
+    recorder.respond = respond
+    assert post(client, '/deleteByIds/', [1]).status_code == 200
+    assert snapshot.combos == {('Person',): 4, ('Link', 'Prop'): 2, ('Name', 'Property'): 2,
+                               ('Attribute', 'Node', 'Place'): 2}
+    assert not snapshot.stale
+
+
+def importResponder(text, parameters):
+    if 'CREATE (n:' in text:
+        return [{'index': row['index'], 'id': 100 + row['index']} for row in parameters['rows']]
+    if 'MERGE (p:Property' in text:
+        return [{'created': len(parameters['rows'])}]
+    if 'Link:Attr' in text and 'rows' in parameters:
+        return [{'index': row['index']} for row in parameters['rows']]
+    return []
+
+
+def importCreated(text, parameters):
+    # Two property links on one new property, one new attribute link
+    if 'MERGE (p:Property' in text:
+        return len(parameters['rows']) + 1
+    if 'Link:Attr' in text and 'rows' in parameters:
+        return len(parameters['rows'])
+    return 0
+
+
+def test_import_applies_the_created_nodes(recorder, client, snapshot):
+    recorder.respond, recorder.created = importResponder, importCreated
+    rows = [{'tmp': 'a', 'labels': ['Node', 'Attribute', 'Place'], 'properties': {'Name': ['x', 'x']}},
+            {'tmp': 'b', 'labels': ['Person'], 'attributes': [{'type': 'lives', 'aid': 'a'}]}]
+    summary = json.loads(post(client, '/import/', rows).data.decode('utf-8'))
+    assert (summary['nodes'], summary['errorCount']) == (2, 0)
+    assert snapshot.combos == {('Person',): 6, ('Link', 'Prop'): 6, ('Name', 'Property'): 4,
+                               ('Attr', 'Link'): 3, ('Attribute', 'Node', 'Place'): 3}
+    assert not snapshot.stale
+
+
+def test_import_with_dates_invalidates(recorder, client, snapshot):
+    recorder.respond = lambda text, parameters: importResponder(text, parameters) or [{'attached': [0]}]
+    post(client, '/import/', [{'labels': ['Person'], 'attributes': [{'type': 'born', 'aid': 'Time:2017'}]}])
+    assert snapshot.combos[('Person',)] == 6
+    assert snapshot.stale
@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+from pymongo.errors import DocumentTooLarge
+
+from graphtulip import layout
+from graphtulip.layout import LayoutCache
+from tests.graphs import makeGraph
+
+BUDGET = 1024 * 1024
+
+
+class Collection(object):
+    def __init__(self, error=None):
+        super(Collection, self).__init__()
+        self.documents = {}
+        self.error = error
+
+    def find_one(self, query):
+        return self.documents.get(query['_id'])
+
+    def replace_one(self, query, document, upsert=False):
+        if self.error:
+            raise self.error
+        self.documents[query['_id']] = document
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = Collection()
+    monkeypatch.setattr(layout.mongo, 'db', {'layouts': collection})
+    return collection
+
+
+def test_round_trip(collection):
+    cache = LayoutCache(BUDGET, True)
+    graph = makeGraph(20, 30)
+    key = cache.key(graph, 'Random layout')
+    cache.store(graph, key)
+    assert key in collection.documents
+    positions = graph.getLayoutProperty("viewLayout")
+    expected = dict((n, positions[n]) for n in graph.getNodes())
+    positions.setAllNodeValue(layout.tlp.Coord(0, 0, 0))
+
+    cache = LayoutCache(BUDGET, True)
+    assert cache.restore(graph, key)
+    assert not cache.restore(graph, 'unknown')
+    assert all(positions[n] == expected[n] for n in graph.getNodes())
+    assert (cache.getStats()['hits'], cache.getStats()['misses']) == (1, 1)
+
+
+def test_oversized_layouts_stay_in_memory(collection):
+    collection.error = DocumentTooLarge("BSON document too large")
+    cache = LayoutCache(BUDGET, True)
+    graph = makeGraph(20, 30)
+    key = cache.key(graph, 'Random layout')
+    cache.store(graph, key)
+    assert not collection.documents
+    assert cache.restore(graph, key)
+    assert cache.getStats()['oversized'] == 1
+
+
+def test_counters_under_concurrency(collection):
+    cache = LayoutCache(BUDGET, False)
+    graph = makeGraph(5, 5)
+    key = cache.key(graph, 'Random layout')
+    cache.store(graph, key)
+
+    def restore():
+        own = makeGraph(5, 5)
+        for i in range(200):
+            cache.restore(own, key if i % 2 else 'unknown')
+
+    threads = [threading.Thread(target=restore) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert (cache.getStats()['hits'], cache.getStats()['misses']) == (400, 400)
+
+
+def test_budget_evicts_least_recent(collection):
+    graphs = [makeGraph(100, 0, seed) for seed in range(3)]
+    keys = ['key%s' % i for i in range(3)]
+    cache = LayoutCache(2 * 100 * (layout.NODE_BYTES + 3) + 1000, False)
+    cache.store(graphs[0], keys[0])
+    cache.store(graphs[1], keys[1])
+    assert cache.restore(graphs[0], keys[0])
+    cache.store(graphs[2], keys[2])
+    assert sorted(cache.entries) == ['key0', 'key2']
+    stats = cache.getStats()
+    assert stats['evictions'] == 1
+    assert stats['size'] == sum(layout.entrySize(cache.entries[key][0]) for key in cache.entries) <= stats['budget']
+
+
+def test_layout_above_budget_not_kept(collection):
+    cache = LayoutCache(1000, True)
+    graph = makeGraph(20, 30)
+    key = cache.key(graph, 'Random layout')
+    cache.store(graph, key)
+    assert not cache.entries
+    assert key in collection.documents
+    assert cache.getStats()['skipped'] == 1
+    assert cache.restore(graph, key)
+    assert not cache.entries
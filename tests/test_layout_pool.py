@@ -0,0 +1,46 @@
+import pytest
+
+from graphtulip.layout import LayoutPool, computeLayout
+from tests.graphs import makeGraph
+
+
+@pytest.fixture
+def pool():
+    pool = LayoutPool(1, 4, 60, 0, 'Circular (OGDF)')
+    yield pool
+    for worker in pool.idle:
+        if worker is not None:
+            worker.terminate()
+
+
+def positions(graph):
+    layout = graph.getLayoutProperty("viewLayout")
+    return [tuple(layout[node][i] for i in range(3)) for node in graph.getNodes()]
+
+
+def expected(graph):
+    index = dict((node.id, i) for i, node in enumerate(graph.getNodes()))
+    edges = [(index[graph.source(edge).id], index[graph.target(edge).id]) for edge in graph.getEdges()]
+    coords, bends = computeLayout(graph.numberOfNodes(), edges, 'Random layout')
+    return [tuple(float(v) for v in coord) for coord in coords]
+
+
+def test_workers_are_reused(pool):
+    for seed in range(3):
+        graph = makeGraph(30, 40, seed)
+        assert pool.run(graph, 'Random layout')
+        assert positions(graph) == pytest.approx(expected(graph))
+    stats = pool.getStats()
+    assert (stats['jobs'], stats['started'], stats['recycled'], stats['timeouts']) == (3, 1, 0, 0)
+
+
+def test_timeout_recycles_the_worker(pool):
+    # A fresh worker cannot start and import tulip within the deadline
+    pool.timeout = 0.01
+    assert not pool.run(makeGraph(30, 40), 'Random layout')
+    assert pool.idle == [None]
+    pool.timeout = 60
+    assert pool.run(makeGraph(30, 40), 'Random layout')
+    stats = pool.getStats()
+    assert (stats['jobs'], stats['started'], stats['recycled'], stats['timeouts']) == (2, 2, 1, 1)
+    assert (stats['running'], stats['waiting']) == (0, 0)
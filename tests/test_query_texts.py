@@ -0,0 +1,49 @@
+import json
+
+
+def texts(recorder, client, urls, method='get', bodies=None):
+    distinct = set()
+    for i, url in enumerate(urls):
+        recorder.clear()
+        if bodies is None:
+            getattr(client, method)(url)
+        else:
+            getattr(client, method)(url, data=json.dumps(bodies[i]), content_type='application/json')
+        assert recorder.texts
+        distinct.update(recorder.texts)
+    return distinct
+
+
+def test_ids_are_parameters(recorder, client):
+    assert len(texts(recorder, client, ['/get/%s?keys=*&attrs=*' % id for id in range(1, 30)])) == 1
+    assert len(texts(recorder, client, ['/getLabels/%s' % id for id in range(1, 30)])) == 1
+    assert not any('987654' in text for text in texts(recorder, client, ['/get/987654', '/getLabels/987654']))
+
+
+def test_id_lists_are_parameters(recorder, client):
+    urls = ['/getByIds/?' + '&'.join('ids=%s' % id for id in range(size)) for size in (1, 2, 10, 100)]
+    assert len(texts(recorder, client, urls)) == 1
+    bodies = [list(range(size)) for size in (1, 2, 10, 100)]
+    assert len(texts(recorder, client, ['/deleteByIds/'] * 4, 'post', bodies)) == 5
+
+
+def test_values_are_parameters(recorder, client):
+    urls = ['/get/Person?keys=name&filters=name:%s&limit=%s' % (name, limit)
+            for name, limit in (('alice', 5), ('bob', 10), ("o'brien", 20))]
+    found = texts(recorder, client, urls)
+    assert len(found) == 1
+    assert not any(value in text for text in found for value in ('alice', "o'brien", '20'))
+
+
+def test_identifiers_shape_the_text(recorder, client):
+    # One text per label or key, whatever else varies
+    urls = ['/countLabel/%s' % label for label in ('Person', 'Post', 'Person', 'Post', 'Person')]
+    assert len(texts(recorder, client, urls)) == 2
+    urls = ['/getPropertyValue/%s/%s' % (label, key) for label in ('Person', 'Post') for key in ('name', 'name', 'age')]
+    assert len(texts(recorder, client, urls)) == 4
+
+
+def test_invalid_identifiers_are_rejected(recorder, client):
+    response = client.get('/countLabel/Person)%20DETACH%20DELETE%20(n')
+    assert response.status_code == 400
+    assert not recorder.texts
@@ -0,0 +1,29 @@
+import json
+
+from tulip import tlp
+
+from routes.serializer import GraphSerializer
+from tests.graphs import makeGraph
+from tests.legacy import getJson
+
+
+def serialize(graph):
+    return json.dumps(GraphSerializer(graph).toDict())
+
+
+def test_same_output_as_legacy_getJson():
+    assert serialize(makeGraph(300, 600)) == json.dumps(getJson(makeGraph(300, 600)))
+
+
+def test_coordinates_keep_their_printed_precision():
+    graph = makeGraph(2, 0)
+    layout = graph.getLayoutProperty("viewLayout")
+    first, second = graph.getNodes()
+    layout[first] = tlp.Coord(0.1, 2.3, 0)
+    layout[second] = tlp.Coord(-0.1, -2.3, 0)
+    assert '"x": 0.1, "y": 2.3' in serialize(graph)
+
+
+def test_edge_type_param():
+    edges = GraphSerializer(makeGraph(10, 10), {'edge_type': 'curve'}).toDict()['edges']
+    assert edges and all(e["type"] == 'curve' for e in edges)
@@ -0,0 +1,75 @@
+import calendar
+import json
+
+import pytest
+
+from routes.generics.setters import parseDate
+
+TIMETREE = ("UNWIND $dates AS date MATCH (n) WHERE ID(n) = date.target"
+            " MERGE (n)-[:HAS]->(l:Link:Attr {type: date.type}) WITH date, l"
+            " CALL ga.timetree.single({time: date.time, resolution: date.resolution, create: true}) YIELD node"
+            " MERGE (l)-[:IS]->(node)")
+
+
+def ms(*date):
+    return calendar.timegm(date + (0, 0, 0)) * 1000
+
+
+@pytest.mark.parametrize('aid, resolution, timestamp', [
+    ('Time:2017', 'YEAR', ms(2017, 1, 1)),
+    ('Time:05/2017', 'MONTH', ms(2017, 5, 1)),
+    ('Time:5/2017', 'MONTH', ms(2017, 5, 1)),
+    ('Time:21/05/2017', 'DAY', ms(2017, 5, 21)),
+    ('Time:1/5/2017', 'DAY', ms(2017, 5, 1)),
+])
+def test_parseDate(aid, resolution, timestamp):
+    assert parseDate(aid) == (resolution, timestamp)
+
+
+@pytest.mark.parametrize('aid', ['2017', 'Time:', 'Time:1/2/3/4', 'Time:32/01/2017', 'Time:year', None, 12])
+def test_parseDate_invalid(aid):
+    with pytest.raises(ValueError):
+        parseDate(aid)
+
+
+def put(client, body):
+    return client.put('/setDates/', data=json.dumps(body), content_type='application/json')
+
+
+@pytest.mark.parametrize('body', [
+    {'target': 1, 'type': 'date', 'aid': 'Time:2017'},
+    [{'target': 1, 'type': 'date', 'aid': '2017'}],
+    [{'target': 1, 'type': 'date', 'aid': 'Time:32/13/2017'}],
+    [{'target': 1, 'type': 'date'}],
+    ['Time:2017'],
+    [None],
+])
+def test_invalid_entries(recorder, client, body):
+    response = put(client, body)
+    assert response.status_code == 400
+    assert not recorder.texts
+
+
+def test_valid_entries(recorder, client):
+    recorder.respond = lambda text, parameters: [{'attached': [0]}]
+    entries = [{'target': 1, 'type': 'date', 'aid': 'Time:21/05/2017'}, {'target': 2, 'type': 'date', 'aid': 'Time:2017'}]
+    response = put(client, entries)
+    assert response.status_code == 200
+    assert json.loads(response.data.decode('utf-8')) == {'applied': entries[:1], 'skipped': entries[1:]}
+    assert len(recorder.texts) == 1
+
+
+def test_timetree_statement(recorder, client):
+    # One statement for every resolution, the 0 padded month reaches the same time tree node as the plain one
+    recorder.respond = lambda text, parameters: [{'attached': [0, 1, 2, 3]}]
+    aids = ['Time:2017', 'Time:05/2017', 'Time:5/2017', 'Time:21/05/2017']
+    put(client, [{'target': 7, 'type': 'date', 'aid': aid} for aid in aids])
+    assert len(recorder.statements) == 1
+    text, parameters = recorder.statements[0]
+    assert text.startswith(TIMETREE)
+    assert parameters == {'dates': [
+        {'index': 0, 'target': 7, 'type': 'date', 'resolution': 'YEAR', 'time': ms(2017, 1, 1)},
+        {'index': 1, 'target': 7, 'type': 'date', 'resolution': 'MONTH', 'time': ms(2017, 5, 1)},
+        {'index': 2, 'target': 7, 'type': 'date', 'resolution': 'MONTH', 'time': ms(2017, 5, 1)},
+        {'index': 3, 'target': 7, 'type': 'date', 'resolution': 'DAY', 'time': ms(2017, 5, 21)},
+    ]}